@@ -1,4 +1,7 @@
-from typing import Any, Optional
+from typing import Any, Hashable, Optional, Tuple
+from functools import lru_cache
+
+import numpy as np
 from pyproj import Transformer
 
 import rasterio as rio
@@ -9,6 +12,56 @@ from rastervision.core.data.crs_transformer import (CRSTransformer,
                                                     IdentityCRSTransformer)
 
 
+def get_pyproj_transformer(src_crs: Any, dst_crs: Any,
+                           always_xy: bool = True) -> Transformer:
+    """Return a (cached) pyproj ``Transformer`` from src_crs to dst_crs.
+
+    Creating a ``Transformer`` involves querying the PROJ database, so
+    transformers are cached and reused. pyproj (>= 3.1) transformers are
+    thread-safe, so the same transformer is shared by all threads.
+
+    Args:
+        src_crs (Any): Source CRS in a format that PyProj can handle.
+        dst_crs (Any): Destination CRS in a format that PyProj can handle.
+        always_xy (bool): See :meth:`pyproj.Transformer.from_crs`. Defaults
+            to True.
+
+    Returns:
+        Transformer: A pyproj ``Transformer``.
+    """
+    if not (isinstance(src_crs, Hashable) and isinstance(dst_crs, Hashable)):
+        return Transformer.from_crs(src_crs, dst_crs, always_xy=always_xy)
+    return _get_pyproj_transformer(src_crs, dst_crs, always_xy)
+
+
+@lru_cache(maxsize=32)
+def _get_pyproj_transformer(src_crs: Any, dst_crs: Any,
+                            always_xy: bool) -> Transformer:
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=always_xy)
+
+
+def apply_affine(transform: Affine, xs: Any,
+                 ys: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Apply an affine transform to arrays of x and y coordinates.
+
+    This is a vectorized equivalent of applying ``transform * (x, y)`` to
+    each point, as is done by rasterio's ``rowcol()`` and ``xy()``.
+
+    Args:
+        transform (Affine): The affine transform.
+        xs (Any): Array-like of x coordinates.
+        ys (Any): Array-like of y coordinates.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Transformed x and y coordinates.
+    """
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    a, b, c, d, e, f, *_ = transform
+    xs_out = xs * a + ys * b + c
+    ys_out = xs * d + ys * e + f
+    return xs_out, ys_out
+
+
 class RasterioCRSTransformer(CRSTransformer):
     """Transformer for a RasterioRasterSource."""
 
@@ -32,9 +85,9 @@ class RasterioCRSTransformer(CRSTransformer):
             self.map2image = lambda *args, **kws: args[:2]
             self.image2map = lambda *args, **kws: args[:2]
         else:
-            self.map2image = Transformer.from_crs(
+            self.map2image = get_pyproj_transformer(
                 map_crs, image_crs, always_xy=True).transform
-            self.image2map = Transformer.from_crs(
+            self.image2map = get_pyproj_transformer(
                 image_crs, map_crs, always_xy=True).transform
 
         self.round_pixels = round_pixels
@@ -73,10 +126,16 @@ class RasterioCRSTransformer(CRSTransformer):
         """
         image_point = self.map2image(*map_point)
         x, y = image_point
-        if self.round_pixels:
-            row, col = rowcol(self.transform, x, y)
+        if np.isscalar(x):
+            if self.round_pixels:
+                row, col = rowcol(self.transform, x, y)
+            else:
+                row, col = rowcol(self.transform, x, y, op=lambda x: x)
         else:
-            row, col = rowcol(self.transform, x, y, op=lambda x: x)
+            col, row = apply_affine(~self.transform, x, y)
+            if self.round_pixels:
+                col = np.floor(col).astype(int)
+                row = np.floor(row).astype(int)
         pixel_point = (col, row)
         return pixel_point
 
@@ -90,9 +149,16 @@ class RasterioCRSTransformer(CRSTransformer):
             (x, y) tuple in map coordinates
         """
         col, row = pixel_point
-        if self.round_pixels:
-            col, row = int(col), int(row)
-        image_point = xy(self.transform, row, col, offset='center')
+        if np.isscalar(col):
+            if self.round_pixels:
+                col, row = int(col), int(row)
+            image_point = xy(self.transform, row, col, offset='center')
+        else:
+            col, row = np.asarray(col), np.asarray(row)
+            if self.round_pixels:
+                col, row = col.astype(int), row.astype(int)
+            # offset to pixel centers
+            image_point = apply_affine(self.transform, col + 0.5, row + 0.5)
         map_point = self.image2map(*image_point)
         return map_point
 
@@ -99,6 +99,8 @@ class ChipClassificationLabelSourceConfig(LabelSourceConfig):
         if self.infer_cells and self.cell_sz is None and not self.lazy:
             raise ValueError('Cannot build with infer_cells=True, '
                              'cell_sz=None and lazy=True.')
+        if crs_transformer is None:
+            raise ValueError('Cannot build with a None crs_transformer.')
         vector_source = self.vector_source.build(class_config, crs_transformer)
         return ChipClassificationLabelSource(
             self, vector_source, extent=extent, lazy=self.lazy)
@@ -40,5 +40,7 @@ class ObjectDetectionLabelSourceConfig(LabelSourceConfig):
 
     def build(self, class_config, crs_transformer, extent,
               tmp_dir=None) -> ObjectDetectionLabelSource:
+        if crs_transformer is None:
+            raise ValueError('Cannot build with a None crs_transformer.')
         vs = self.vector_source.build(class_config, crs_transformer)
         return ObjectDetectionLabelSource(vs, extent)
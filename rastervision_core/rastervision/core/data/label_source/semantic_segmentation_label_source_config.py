@@ -28,8 +28,11 @@ class SemanticSegmentationLabelSourceConfig(LabelSourceConfig):
 
     def build(self, class_config, crs_transformer, extent, tmp_dir):
         if isinstance(self.raster_source, RasterizedSourceConfig):
+            if crs_transformer is None:
+                raise ValueError('Cannot build with a None crs_transformer.')
             rs = self.raster_source.build(class_config, crs_transformer,
                                           extent)
         else:
+            # label rasters carry their own georeferencing
             rs = self.raster_source.build(tmp_dir)
         return SemanticSegmentationLabelSource(rs, class_config)
@@ -18,6 +18,8 @@ class ChipClassificationGeoJSONStoreConfig(LabelStoreConfig):
          ))
 
     def build(self, class_config, crs_transformer, extent=None, tmp_dir=None):
+        if crs_transformer is None:
+            raise ValueError('Cannot build with a None crs_transformer.')
         return ChipClassificationGeoJSONStore(self.uri, class_config,
                                               crs_transformer)
 
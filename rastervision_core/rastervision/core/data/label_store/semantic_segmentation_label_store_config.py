@@ -124,6 +124,8 @@ class SemanticSegmentationLabelStoreConfig(LabelStoreConfig):
         'be set to this.')
 
     def build(self, class_config, crs_transformer, extent, tmp_dir):
+        if crs_transformer is None:
+            raise ValueError('Cannot build with a None crs_transformer.')
         class_config.ensure_null_class()
 
         label_store = SemanticSegmentationLabelStore(
@@ -7,6 +7,8 @@ from rastervision.core.data.raster_source.rasterized_source import *
 from rastervision.core.data.raster_source.rasterized_source_config import *
 from rastervision.core.data.raster_source.multi_raster_source import *
 from rastervision.core.data.raster_source.multi_raster_source_config import *
+from rastervision.core.data.raster_source.constant_raster_source import *
+from rastervision.core.data.raster_source.constant_raster_source_config import *
 
 __all__ = [
     RasterSource.__name__,
@@ -18,4 +20,6 @@ __all__ = [
     RasterizerConfig.__name__,
     MultiRasterSource.__name__,
     MultiRasterSourceConfig.__name__,
+    ConstantRasterSource.__name__,
+    ConstantRasterSourceConfig.__name__,
 ]
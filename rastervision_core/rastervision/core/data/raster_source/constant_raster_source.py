@@ -0,0 +1,105 @@
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from rastervision.core.box import Box
+from rastervision.core.data.crs_transformer import IdentityCRSTransformer
+from rastervision.core.data.raster_source import RasterSource
+from rastervision.core.data.raster_source.rasterio_source import fill_overflow
+
+if TYPE_CHECKING:
+    from rastervision.core.data import CRSTransformer, RasterTransformer
+
+
+class ConstantRasterSource(RasterSource):
+    """A :class:`.RasterSource` in which every pixel has the same value.
+
+    Chips are returned as read-only broadcasted views of a single pixel, so
+    reading a chip takes constant time and memory regardless of its size. If
+    there are ``raster_transformers``, a writeable copy is made before they
+    are applied.
+    """
+
+    def __init__(self,
+                 value: Union[float, Sequence[float]],
+                 shape: Tuple[int, int],
+                 dtype: Union[str, np.dtype] = np.uint8,
+                 crs_transformer: Optional['CRSTransformer'] = None,
+                 raster_transformers: List['RasterTransformer'] = [],
+                 channel_order: Optional[List[int]] = None,
+                 extent: Optional[Box] = None):
+        """Constructor.
+
+        Args:
+            value (Union[float, Sequence[float]]): Value of every pixel. If a
+                sequence, each element is the value of one channel.
+            shape (Tuple[int, int]): (height, width) of the raster.
+            dtype (Union[str, np.dtype]): dtype of the raster. Defaults to
+                uint8.
+            crs_transformer (Optional[CRSTransformer]): A CRS transformer. If
+                None, an :class:`.IdentityCRSTransformer` is used. Defaults to
+                None.
+            raster_transformers (List[RasterTransformer]): RasterTransformers
+                to use to transform chips after they are read. Defaults to
+                ``[]``.
+            channel_order (Optional[List[int]]): List of indices of channels
+                to extract from the raw imagery. Defaults to None.
+            extent (Optional[Box]): User-specified extent. If given, the
+                raster is cropped to this extent. Defaults to None.
+        """
+        self.value = np.array(value, dtype=dtype).reshape(-1)
+        self.full_extent = Box(0, 0, *shape)
+        if extent is None:
+            extent = self.full_extent
+        if crs_transformer is None:
+            crs_transformer = IdentityCRSTransformer()
+        self._crs_transformer = crs_transformer
+        self._dtype = None
+
+        super().__init__(
+            channel_order,
+            num_channels_raw=len(self.value),
+            raster_transformers=raster_transformers,
+            extent=extent)
+
+    @property
+    def dtype(self) -> np.dtype:
+        if self._dtype is None:
+            self._dtype = self.get_chip(Box(0, 0, 1, 1)).dtype
+        return self._dtype
+
+    @property
+    def crs_transformer(self) -> 'CRSTransformer':
+        return self._crs_transformer
+
+    def _get_chip(self, window: Box,
+                  channel_order: Optional[List[int]] = None) -> np.ndarray:
+        """Return the chip in the window, optionally after channel_order.
+
+        The chip is a read-only view unless the window extends beyond the
+        extent, in which case the overflowing pixels are filled with zeros.
+        """
+        value = self.value
+        if channel_order is not None:
+            value = value[channel_order]
+        window = window.shift_origin(self.extent)
+        chip = np.broadcast_to(value, (*window.size, len(value)))
+        if window.intersection(self.extent) != window:
+            chip = fill_overflow(self.extent, window, chip.copy())
+        return chip
+
+    def get_chip(self, window: Box) -> np.ndarray:
+        """Return the transformed chip in the window.
+
+        Args:
+            window (Box): The window for which to get the chip.
+
+        Returns:
+            np.ndarray: Array of shape (height, width, channels).
+        """
+        chip = self._get_chip(window, channel_order=self.channel_order)
+        if len(self.raster_transformers) > 0:
+            chip = np.array(chip)
+            for transformer in self.raster_transformers:
+                chip = transformer.transform(chip, self.channel_order)
+        return chip
@@ -0,0 +1,32 @@
+from typing import List, Tuple, Union
+
+from pydantic import conint
+
+from rastervision.pipeline.config import Field, register_config
+from rastervision.core.data.raster_source import (RasterSourceConfig,
+                                                  ConstantRasterSource)
+
+
+@register_config('constant_raster_source')
+class ConstantRasterSourceConfig(RasterSourceConfig):
+    """Configure a :class:`.ConstantRasterSource`."""
+
+    value: Union[float, List[float]] = Field(
+        ...,
+        description='Value of every pixel. If a list, each element is the '
+        'value of one channel.')
+    shape: Tuple[conint(gt=0), conint(gt=0)] = Field(
+        ..., description='(height, width) of the raster.')
+    dtype: str = Field('uint8', description='dtype of the raster.')
+
+    def build(self, tmp_dir=None, use_transformers=True):
+        raster_transformers = ([rt.build() for rt in self.transformers]
+                               if use_transformers else [])
+
+        return ConstantRasterSource(
+            value=self.value,
+            shape=self.shape,
+            dtype=self.dtype,
+            raster_transformers=raster_transformers,
+            channel_order=self.channel_order,
+            extent=self.extent)
@@ -1,4 +1,4 @@
-from typing import Optional, Sequence, List, Tuple
+from typing import Dict, Optional, Sequence, List, Tuple
 from pydantic import conint
 
 import numpy as np
@@ -7,6 +7,9 @@ from rastervision.core.box import Box
 from rastervision.core.data.raster_source import RasterSource
 from rastervision.core.data.crs_transformer import CRSTransformer
 from rastervision.core.data.raster_source.rasterio_source import RasterioSource
+from rastervision.core.data.raster_transformer import ReclassTransformer
+from rastervision.core.data.raster_transformer.reclass_transformer import (
+    LUT_DTYPES)
 from rastervision.core.data.utils import all_equal
 
 
@@ -60,9 +63,67 @@ class MultiRasterSource(RasterSource):
 
         self.extents = [rs.extent for rs in self.raster_sources]
         self.all_extents_equal = all_equal(self.extents)
+        self.read_keys = self._get_read_keys()
 
         self.validate_raster_sources()
 
+        self.stacked_lut = self._get_stacked_lut()
+
+    def _get_read_keys(self) -> List[Optional[tuple]]:
+        """Find sub-``RasterSources`` that read the exact same data.
+
+        Sub-``RasterSources`` that are :class:`.RasterioSource` instances over the
+        same file with the same channels and extent are assigned the same key.
+        When reading a window, the data is read only once per key and shared
+        (before applying each sub-``RasterSource``'s transformers).
+        Sub-``RasterSources`` that do not share their data with any other are
+        assigned None.
+        """
+        keys = []
+        for rs in self.raster_sources:
+            if isinstance(rs, RasterioSource):
+                key = (rs.imagery_path, tuple(rs.bands_to_read), rs.extent,
+                       rs.is_masked)
+            else:
+                key = None
+            keys.append(key)
+        key_counts = {}
+        for key in keys:
+            key_counts[key] = key_counts.get(key, 0) + 1
+        keys = [k if key_counts[k] > 1 else None for k in keys]
+        return keys
+
+    def _get_stacked_lut(self) -> Optional[np.ndarray]:
+        """Combine sub-``RasterSources`` that only reclassify shared data.
+
+        If all sub-``RasterSources`` read the exact same data (see
+        :meth:`._get_read_keys`) and only differ in the
+        :class:`.ReclassTransformer` instances applied to it, their
+        transformers are collapsed into a single lookup table of shape
+        (num_levels, num_sub_sources). Indexing it with the shared data yields
+        all the sub-chips at once.
+
+        Returns:
+            Optional[np.ndarray]: The lookup table or None if not applicable.
+        """
+        if self.read_keys[0] is None or not all_equal(self.read_keys):
+            return None
+        if not all(
+                isinstance(t, ReclassTransformer) for rs in self.raster_sources
+                for t in rs.raster_transformers):
+            return None
+        # reclassification does not change the dtype
+        dtype = np.dtype(self.primary_source.dtype)
+        if dtype not in LUT_DTYPES:
+            return None
+        luts = []
+        for rs in self.raster_sources:
+            lut = np.arange(np.iinfo(dtype).max + 1, dtype=dtype)
+            for transformer in rs.raster_transformers:
+                lut = transformer.get_lut(dtype)[lut]
+            luts.append(lut)
+        return np.stack(luts, axis=-1)
+
     def validate_raster_sources(self) -> None:
         """Validate sub-``RasterSources``.
 
@@ -125,30 +186,59 @@ class MultiRasterSource(RasterSource):
             List[np.ndarray]: List of chips from each sub raster source.
         """
 
-        def get_chip(
-                rs: RasterSource,
-                window: Box,
-                out_shape: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        # (read key, window, out_shape, raw) --> chip
+        read_cache: Dict[tuple, np.ndarray] = {}
+
+        def get_chip(i: int,
+                     window: Box,
+                     out_shape: Optional[Tuple[int, int]] = None
+                     ) -> np.ndarray:
+            rs = self.raster_sources[i]
+            read_key = self.read_keys[i]
+            if read_key is None:
+                if raw:
+                    return rs._get_chip(window, out_shape=out_shape)
+                return rs.get_chip(window, out_shape=out_shape)
+
+            # reading with an out_shape equal to the window size is the same
+            # as reading without one
+            if out_shape is not None and tuple(out_shape) == window.size:
+                out_shape = None
+            cache_key = (read_key, window, out_shape, raw)
+            chip = read_cache.get(cache_key)
+            if chip is None:
+                bands = None if raw else rs.bands_to_read
+                chip = rs._get_chip(window, bands=bands, out_shape=out_shape)
+                read_cache[cache_key] = chip
             if raw:
-                return rs._get_chip(window, out_shape=out_shape)
-            return rs.get_chip(window, out_shape=out_shape)
+                return chip
+            # transformers might modify the chip in-place
+            chip = chip.copy()
+            for transformer in rs.raster_transformers:
+                chip = transformer.transform(chip, rs.channel_order)
+            return chip
 
         if self.all_extents_equal:
-            sub_chips = [get_chip(rs, window) for rs in self.raster_sources]
+            sub_chips = [
+                get_chip(i, window) for i in range(len(self.raster_sources))
+            ]
         else:
             primary_rs = self.primary_source
-            other_rses = [rs for rs in self.raster_sources if rs != primary_rs]
+            other_inds = [
+                i for i, rs in enumerate(self.raster_sources)
+                if rs != primary_rs
+            ]
 
-            primary_sub_chip = get_chip(primary_rs, window)
+            primary_sub_chip = get_chip(self.primary_source_idx, window)
             out_shape = primary_sub_chip.shape[:2]
             world_window = primary_rs.crs_transformer.pixel_to_map(window)
             pixel_windows = [
-                rs.crs_transformer.map_to_pixel(world_window)
-                for rs in other_rses
+                self.raster_sources[i].crs_transformer.map_to_pixel(
+                    world_window) for i in other_inds
             ]
             sub_chips = [
-                get_chip(rs, w, out_shape=out_shape)
-                for rs, w in zip(other_rses, pixel_windows)
+                get_chip(i, w, out_shape=out_shape)
+                for i, w in zip(other_inds, pixel_windows)
             ]
             sub_chips.insert(self.primary_source_idx, primary_sub_chip)
 
@@ -186,8 +276,17 @@ class MultiRasterSource(RasterSource):
         Returns:
             np.ndarray with shape [height, width, channels]
         """
-        sub_chips = self._get_sub_chips(window, raw=False)
-        chip = np.concatenate(sub_chips, axis=-1)
+        if self.stacked_lut is not None:
+            # read the shared data once and reclassify it for all
+            # sub-RasterSources in a single lookup
+            rs = self.primary_source
+            chip = rs._get_chip(window, bands=rs.bands_to_read)
+            # (h, w, c, n) --> (h, w, n * c)
+            chip = self.stacked_lut[chip].swapaxes(-1, -2)
+            chip = chip.reshape(*chip.shape[:2], -1)
+        else:
+            sub_chips = self._get_sub_chips(window, raw=False)
+            chip = np.concatenate(sub_chips, axis=-1)
         chip = chip[..., self.channel_order]
 
         for transformer in self.raster_transformers:
@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
+
 from rastervision.core.data.raster_transformer import RasterTransformer
 
-if TYPE_CHECKING:
-    import numpy as np
+# dtypes for which reclassification is done via a lookup table
+LUT_DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16))
 
 
 class ReclassTransformer(RasterTransformer):
@@ -15,13 +18,41 @@ class ReclassTransformer(RasterTransformer):
             mapping: (dict) Remapping dictionary
         """
         self.mapping = mapping
+        self._luts: Dict[np.dtype, np.ndarray] = {}
+
+    def get_lut(self, dtype: np.dtype) -> Optional[np.ndarray]:
+        """Return a lookup table implementing the mapping for the dtype.
+
+        The lookup table is an array, ``lut``, such that ``lut[chip]`` is the
+        reclassified chip. It is only available for uint8 and uint16 dtypes
+        and is built once per dtype.
+
+        Args:
+            dtype (np.dtype): dtype of the chips to be reclassified.
+
+        Returns:
+            Optional[np.ndarray]: The lookup table or None if dtype is not
+            supported.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in LUT_DTYPES:
+            return None
+        lut = self._luts.get(dtype)
+        if lut is None:
+            lut = np.arange(np.iinfo(dtype).max + 1, dtype=dtype)
+            for value_from, value_to in self.mapping.items():
+                if 0 <= value_from < len(lut):
+                    lut[value_from] = value_to
+            self._luts[dtype] = lut
+        return lut
 
     def transform(self,
                   chip: 'np.ndarray',
                   channel_order: Optional[List[int]] = None):
         """Transform a chip.
 
-        Reclassify a label raster using the given mapping.
+        Reclassify a label raster using the given mapping. For uint8 and
+        uint16 chips, this is a single lookup-table indexing operation.
 
         Args:
             chip: ndarray of shape [height, width, channels] This is assumed to already
@@ -34,6 +65,10 @@ class ReclassTransformer(RasterTransformer):
             [height, width, channels] numpy array
 
         """
+        lut = self.get_lut(chip.dtype)
+        if lut is not None:
+            return lut[chip]
+
         masks = []
         for (value_from, value_to) in self.mapping.items():
             mask = (chip == value_from)
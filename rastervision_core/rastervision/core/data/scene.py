@@ -1,26 +1,48 @@
-from typing import TYPE_CHECKING, Any, Optional, Tuple
+from typing import (TYPE_CHECKING, Any, Callable, List, Optional, Sequence,
+                    Tuple, Union)
+
+import numpy as np
+from shapely.strtree import STRtree
+
+from rastervision.core.data.utils import morton_encode
 
 if TYPE_CHECKING:
+    from shapely.geometry import Polygon
     from rastervision.core.box import Box
     from rastervision.core.data import (RasterSource, LabelSource, LabelStore)
 
+# AOI envelopes are rasterized onto a 2^AOI_GRID_LEVEL x 2^AOI_GRID_LEVEL grid
+# for quick rejection of windows that are not within any AOI polygon
+AOI_GRID_LEVEL = 8
+
 
 class Scene:
-    """The raster data and labels associated with an area of interest."""
-
-    def __init__(self,
-                 id: str,
-                 raster_source: 'RasterSource',
-                 label_source: Optional['LabelSource'] = None,
-                 label_store: Optional['LabelStore'] = None,
-                 aoi_polygons: Optional[list] = None):
+    """The raster data and labels associated with an area of interest.
+
+    The raster source, label source, and label store can each be provided
+    either as an already-built object or as a zero-argument callable that
+    builds it. In the latter case, the object is only built when it is first
+    accessed. Instances of RasterSource, LabelSource, and LabelStore are
+    always treated as already built, even if they are callable.
+    """
+
+    def __init__(
+            self,
+            id: str,
+            raster_source: Union['RasterSource', Callable[[], 'RasterSource']],
+            label_source: Optional[Union['LabelSource', Callable[
+                [], 'LabelSource']]] = None,
+            label_store: Optional[Union['LabelStore', Callable[
+                [], 'LabelStore']]] = None,
+            aoi_polygons: Optional[list] = None):
         """Construct a new Scene.
 
         Args:
             id: ID for this scene
-            raster_source: RasterSource for this scene
-            ground_truth_label_store: optional LabelSource
-            label_store: optional LabelStore
+            raster_source: RasterSource for this scene or a callable that
+                returns one.
+            label_source: optional LabelSource or a callable that returns one.
+            label_store: optional LabelStore or a callable that returns one.
             aoi: Optional list of AOI polygons in pixel coordinates
         """
         self.id = id
@@ -32,6 +54,199 @@ class Scene:
         else:
             self.aoi_polygons = aoi_polygons
 
+    @property
+    def aoi_polygons(self) -> List['Polygon']:
+        """AOI polygons in pixel coordinates."""
+        return self._aoi_polygons
+
+    @aoi_polygons.setter
+    def aoi_polygons(self, aoi_polygons: List['Polygon']) -> None:
+        self._aoi_polygons = aoi_polygons
+        self._aoi_index = None
+        self._aoi_grid = None
+
+    @property
+    def aoi_index(self) -> Optional[STRtree]:
+        """Spatial index over the AOI polygons. Built on first access.
+
+        None if the scene has no AOI polygons.
+        """
+        if self._aoi_index is None and len(self.aoi_polygons) > 0:
+            self._aoi_index = STRtree(self.aoi_polygons)
+        return self._aoi_index
+
+    def aoi_contains(self, window: 'Box', within: bool = True) -> bool:
+        """Check if the window is inside the scene's AOI.
+
+        Only AOI polygons whose envelopes intersect the window are checked. To
+        check many windows at once, :meth:`.filter_windows` is faster.
+
+        Args:
+            window (Box): Window in pixel coordinates.
+            within (bool): If True, the window must lie fully within an AOI
+                polygon. Otherwise, it only needs to intersect one.
+                Defaults to True.
+
+        Returns:
+            bool: Whether the window is inside the AOI. Always True if the
+            scene has no AOI polygons.
+        """
+        if len(self.aoi_polygons) == 0:
+            return True
+        w = window.to_shapely()
+        for polygon in self.aoi_index.query(w):
+            if w.within(polygon) if within else w.intersects(polygon):
+                return True
+        return False
+
+    def filter_windows(self, windows: Sequence['Box'],
+                       within: bool = True) -> List['Box']:
+        """Return the windows that are inside the scene's AOI.
+
+        Equivalent to ``[w for w in windows if self.aoi_contains(w, within)]``
+        but faster. If within=True, windows whose corners do not all fall in
+        grid cells covered by AOI envelopes are first rejected in a single
+        vectorized step.
+
+        Args:
+            windows (Sequence[Box]): Windows in pixel coordinates.
+            within (bool): If True, a window must lie fully within an AOI
+                polygon. Otherwise, it only needs to intersect one.
+                Defaults to True.
+
+        Returns:
+            List[Box]: The windows inside the AOI. All of them if the scene
+            has no AOI polygons.
+        """
+        if len(self.aoi_polygons) == 0 or len(windows) == 0:
+            return list(windows)
+        if within:
+            in_grid = self._aoi_grid_contains(windows)
+            windows = [w for w, keep in zip(windows, in_grid) if keep]
+        return [w for w in windows if self.aoi_contains(w, within=within)]
+
+    @property
+    def raster_source(self) -> 'RasterSource':
+        """The :class:`.RasterSource`. Built on first access if needed."""
+        return self._get_or_build('_raster_source')
+
+    @raster_source.setter
+    def raster_source(self, raster_source) -> None:
+        self._raster_source = raster_source
+
+    @property
+    def label_source(self) -> Optional['LabelSource']:
+        """The :class:`.LabelSource`. Built on first access if needed."""
+        return self._get_or_build('_label_source')
+
+    @label_source.setter
+    def label_source(self, label_source) -> None:
+        self._label_source = label_source
+
+    @property
+    def label_store(self) -> Optional['LabelStore']:
+        """The :class:`.LabelStore`. Built on first access if needed."""
+        return self._get_or_build('_label_store')
+
+    @label_store.setter
+    def label_store(self, label_store) -> None:
+        self._label_store = label_store
+
+    def _aoi_grid_contains(self, windows: Sequence['Box']) -> np.ndarray:
+        """Check which windows have all corners in AOI-covered grid cells.
+
+        This is a necessary (but not sufficient) condition for a window to
+        lie within an AOI polygon.
+
+        Returns:
+            np.ndarray: Boolean array with one element per window.
+        """
+        if self._aoi_grid is None:
+            self._aoi_grid = self._build_aoi_grid()
+        codes, to_cells = self._aoi_grid
+        if len(codes) == 0:
+            return np.zeros(len(windows), dtype=bool)
+        ymin, xmin, ymax, xmax = np.array(
+            [tuple(w) for w in windows], dtype=float).T
+        # (num_windows, 4) corners
+        xs = np.stack((xmin, xmax, xmin, xmax), axis=-1)
+        ys = np.stack((ymin, ymin, ymax, ymax), axis=-1)
+        cols, rows, in_bounds = to_cells(xs, ys)
+        corner_codes = morton_encode(cols, rows)
+        inds = np.searchsorted(codes, corner_codes)
+        inds = np.minimum(inds, len(codes) - 1)
+        covered = (codes[inds] == corner_codes) & in_bounds
+        return np.all(covered, axis=-1)
+
+    def _build_aoi_grid(self) -> Tuple[np.ndarray, Callable]:
+        """Compute sorted Morton codes of grid cells covered by AOI envelopes.
+
+        Returns:
+            Tuple[np.ndarray, Callable]: The sorted codes and a function that
+            maps (x, y) arrays to grid (col, row) arrays along with a boolean
+            array indicating which points lie inside the grid.
+        """
+        bounds = np.array(
+            [p.bounds for p in self.aoi_polygons if not p.is_empty],
+            dtype=float).reshape(-1, 4)
+        if len(bounds) == 0:
+            return np.array([], dtype=np.uint32), None
+        x0, y0 = bounds[:, 0].min(), bounds[:, 1].min()
+        x1, y1 = bounds[:, 2].max(), bounds[:, 3].max()
+        n = 2**AOI_GRID_LEVEL
+        cell_w = max(x1 - x0, 1e-9) / n
+        cell_h = max(y1 - y0, 1e-9) / n
+
+        def to_cells(x: np.ndarray, y: np.ndarray) -> tuple:
+            in_bounds = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+            cols = np.clip(((x - x0) // cell_w).astype(int), 0, n - 1)
+            rows = np.clip(((y - y0) // cell_h).astype(int), 0, n - 1)
+            return cols, rows, in_bounds
+
+        # mark the cells covered by each envelope in an (n, n) grid via a 2D
+        # difference array so that memory use does not depend on the number
+        # or size of the polygons
+        cmins, rmins, _ = to_cells(bounds[:, 0], bounds[:, 1])
+        cmaxs, rmaxs, _ = to_cells(bounds[:, 2], bounds[:, 3])
+        diff = np.zeros((n + 1, n + 1), dtype=np.int32)
+        np.add.at(diff, (rmins, cmins), 1)
+        np.add.at(diff, (rmins, cmaxs + 1), -1)
+        np.add.at(diff, (rmaxs + 1, cmins), -1)
+        np.add.at(diff, (rmaxs + 1, cmaxs + 1), 1)
+        covered = diff.cumsum(axis=0).cumsum(axis=1)[:n, :n] > 0
+        rows, cols = np.nonzero(covered)
+        codes = np.sort(morton_encode(cols, rows))
+        return codes, to_cells
+
+    def _get_or_build(self, attr: str) -> Any:
+        """Return the value of attr, first building it if it is a builder.
+
+        Instances of RasterSource, LabelSource, and LabelStore are never
+        treated as builders, even if they happen to be callable.
+        """
+        val = getattr(self, attr)
+        if callable(val) and not self._is_built(val):
+            val = val()
+            setattr(self, attr, val)
+        return val
+
+    @staticmethod
+    def _is_built(val: Any) -> bool:
+        # use local imports to avoid circular import problems
+        from rastervision.core.data import (RasterSource, LabelSource,
+                                            LabelStore)
+        return isinstance(val, (RasterSource, LabelSource, LabelStore))
+
+    def __getstate__(self) -> dict:
+        # builders are usually closures, which cannot be pickled
+        for attr in ('_raster_source', '_label_source', '_label_store'):
+            self._get_or_build(attr)
+        # the spatial indices are rebuilt on demand
+        state = self.__dict__.copy()
+        state['_aoi_index'] = None
+        state['_aoi_grid'] = None
+        return state
+
     @property
     def extent(self) -> 'Box':
         """Extent of the associated :class:`.RasterSource`."""
@@ -1,4 +1,5 @@
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
+from functools import lru_cache
 
 from rastervision.pipeline.config import (Config, ConfigError, register_config,
                                           Field)
@@ -8,6 +9,9 @@ from rastervision.core.data.label_store import LabelStoreConfig
 from rastervision.core.data.scene import Scene
 from rastervision.core.data.utils import get_polygons_from_uris
 
+if TYPE_CHECKING:
+    from rastervision.core.data import (RasterSource, LabelSource, LabelStore)
+
 
 def scene_config_upgrader(cfg_dict: dict, version: int) -> dict:
     if version == 4:
@@ -40,29 +44,64 @@ class SceneConfig(Config):
         'that is assumed to be fully labeled and usable for training or '
         'validation. The AOIs are assumed to be in EPSG:4326 coordinates.')
 
-    def build(self, class_config, tmp_dir, use_transformers=True) -> Scene:
-        raster_source = self.raster_source.build(
-            tmp_dir, use_transformers=use_transformers)
-        crs_transformer = raster_source.crs_transformer
-        extent = raster_source.extent
+    def build(self,
+              class_config,
+              tmp_dir,
+              use_transformers=True,
+              build_label_store=True) -> Scene:
+        """Build a :class:`.Scene`.
+
+        The label source and label store are not built here; instead, the
+        returned Scene builds each of them on first access. The same goes for
+        the raster source, unless ``aoi_uris`` is set, in which case it is
+        built right away since its CRS transformer is needed to read the AOI
+        polygons. Either way, the raster source is built at most once and its
+        CRS transformer and extent are shared with the label source and label
+        store.
+
+        Args:
+            class_config (ClassConfig): The class config.
+            tmp_dir (str): Temporary directory to use.
+            use_transformers (bool): Whether to apply the raster source's
+                transformers. Defaults to True.
+            build_label_store (bool): If False, the Scene will not have a
+                label store. Useful when predictions are not going to be
+                saved, e.g. during training. Defaults to True.
+        """
+        raster_source_cfg = self.raster_source
+        label_source_cfg = self.label_source
+        label_store_cfg = self.label_store if build_label_store else None
+
+        @lru_cache(maxsize=1)
+        def make_raster_source() -> 'RasterSource':
+            return raster_source_cfg.build(
+                tmp_dir, use_transformers=use_transformers)
+
+        def make_label_source() -> 'LabelSource':
+            raster_source = make_raster_source()
+            return label_source_cfg.build(class_config,
+                                          raster_source.crs_transformer,
+                                          raster_source.extent, tmp_dir)
 
-        label_source = (self.label_source.build(class_config, crs_transformer,
-                                                extent, tmp_dir)
-                        if self.label_source is not None else None)
-        label_store = (self.label_store.build(class_config, crs_transformer,
-                                              extent, tmp_dir)
-                       if self.label_store is not None else None)
+        def make_label_store() -> 'LabelStore':
+            raster_source = make_raster_source()
+            return label_store_cfg.build(class_config,
+                                         raster_source.crs_transformer,
+                                         raster_source.extent, tmp_dir)
 
         aoi_polygons = []
         if self.aoi_uris is not None:
-            aoi_polygons += get_polygons_from_uris(self.aoi_uris,
-                                                   crs_transformer)
+            crs_transformer = make_raster_source().crs_transformer
+            aoi_polygons += get_polygons_from_uris(
+                self.aoi_uris, crs_transformer, tmp_dir=tmp_dir)
 
         return Scene(
             self.id,
-            raster_source,
-            label_source=label_source,
-            label_store=label_store,
+            make_raster_source,
+            label_source=(make_label_source
+                          if label_source_cfg is not None else None),
+            label_store=(make_label_store
+                         if label_store_cfg is not None else None),
             aoi_polygons=aoi_polygons)
 
     def update(self, pipeline=None):
@@ -1,10 +1,21 @@
-from typing import (TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List,
-                    Optional, Union)
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator,
+                    List, Optional, Tuple, Union)
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-
+from hashlib import sha256
+from itertools import chain, islice
+import os
+from os.path import isfile, join
+import pickle
+from threading import Lock, get_ident
+
+import numpy as np
 from shapely.geometry import shape, mapping
 from tqdm.auto import tqdm
 
+from rastervision.pipeline.file_system import (FileSystem, LocalFileSystem,
+                                               make_dir)
 from rastervision.core.data.utils.misc import listify_uris
 
 if TYPE_CHECKING:
@@ -13,6 +24,17 @@ if TYPE_CHECKING:
 
 MULTI_GEOM_TYPES = {'MultiPolygon', 'MultiPoint', 'MultiLineString'}
 PROGRESSBAR_DELAY_SEC = 5
+AOI_CACHE_SIZE = 128
+AOI_MAX_WORKERS = 8
+# number of AOI features transformed to pixel coords at a time
+AOI_STREAM_BATCH_SIZE = 1024
+# class IDs at or above this are not included in buffer lookup tables
+MAX_BUF_LUT_SIZE = 2**16
+
+# (uri, file version, crs_transformer key) --> (crs_transformer, tuple of
+# polygons in pixel coords)
+_aoi_geoms_cache = OrderedDict()
+_aoi_geoms_cache_lock = Lock()
 
 
 def geometry_to_feature(mapping: dict,
@@ -103,6 +125,14 @@ def geojson_to_geoms(geojson: dict) -> Iterator['BaseGeometry']:
     return geoms
 
 
+def geojson_to_geoms_stream(
+        features: Iterable[dict]) -> Iterator['BaseGeometry']:
+    """Lazily return the shapely geometry for each of the GeoJSON features.
+    """
+    for f in features:
+        yield shape(f['geometry'])
+
+
 def geoms_to_geojson(geoms: Iterable['BaseGeometry'],
                      properties: Optional[Iterable[dict]] = None) -> dict:
     """Serialize shapely geometries to GeoJSON."""
@@ -231,19 +261,113 @@ def split_multi_geometries(geojson: dict) -> dict:
 def map_to_pixel_coords(geojson: dict,
                         crs_transformer: 'CRSTransformer') -> dict:
     """Convert a GeoJSON dict from map to pixel coordinates."""
-    return map_geoms(
-        lambda g, **kw: crs_transformer.map_to_pixel(g),
-        geojson,
-        progressbar_kw=dict(desc='Transforming to pixel coords'))
+    return transform_geojson_coords(geojson, crs_transformer.map_to_pixel)
 
 
 def pixel_to_map_coords(geojson: dict,
                         crs_transformer: 'CRSTransformer') -> dict:
     """Convert a GeoJSON dict from pixel to map coordinates."""
-    return map_geoms(
-        lambda g, **kw: crs_transformer.pixel_to_map(g),
-        geojson,
-        progressbar_kw=dict(desc='Transforming to map coords'))
+    return transform_geojson_coords(geojson, crs_transformer.pixel_to_map)
+
+
+def transform_geojson_coords(geojson: dict,
+                             func: Callable[[tuple], tuple]) -> dict:
+    """Apply a coordinate transformation to all geometries in a GeoJSON.
+
+    The coordinates of all the geometries are gathered into a single pair of
+    x and y arrays so that func is only called once. Any z-coordinates are
+    dropped.
+
+    Args:
+        geojson (dict): A GeoJSON-like mapping of a FeatureCollection.
+        func (Callable): Function that takes an (xs, ys) tuple of arrays and
+            returns a tuple of transformed (xs, ys) arrays.
+
+    Returns:
+        dict: A new FeatureCollection with transformed geometries.
+    """
+    features_in = geojson['features']
+
+    # gather coordinates
+    coord_arrays = []
+    for f in features_in:
+        _get_coord_arrays(f['geometry'], coord_arrays)
+    num_coords = sum(len(a) for a in coord_arrays)
+    if num_coords > 0:
+        coords = np.concatenate(coord_arrays)
+        xs, ys = func((coords[:, 0], coords[:, 1]))
+        coords = np.stack([xs, ys], axis=-1).astype(float).reshape(-1, 2)
+        split_inds = np.cumsum([len(a) for a in coord_arrays])[:-1]
+        coord_arrays = np.split(coords, split_inds)
+
+    # rebuild geometries with transformed coordinates
+    coord_arrays = iter(coord_arrays)
+    features_out = [
+        geometry_to_feature(
+            _set_coord_arrays(f['geometry'], coord_arrays),
+            f.get('properties', {})) for f in features_in
+    ]
+    return features_to_geojson(features_out)
+
+
+# nesting depth of sequences of points in the "coordinates" of each geom type
+_GEOM_TYPE_TO_DEPTH = {
+    'Point': 0,
+    'MultiPoint': 1,
+    'LineString': 1,
+    'MultiLineString': 2,
+    'Polygon': 2,
+    'MultiPolygon': 3,
+}
+
+
+def _get_coord_arrays(geometry: dict, out: List[np.ndarray]) -> None:
+    """Append (N, 2) arrays of the geometry's coordinates to out."""
+    if geometry['type'] == 'GeometryCollection':
+        for g in geometry['geometries']:
+            _get_coord_arrays(g, out)
+        return
+
+    def collect(coords: list, depth: int) -> None:
+        if depth > 1:
+            for c in coords:
+                collect(c, depth - 1)
+            return
+        if depth == 0:
+            coords = [coords]
+        arr = np.array(coords, dtype=float)
+        if arr.size == 0:
+            out.append(np.empty((0, 2)))
+        else:
+            out.append(arr.reshape(len(arr), -1)[:, :2])
+
+    collect(geometry['coordinates'], _GEOM_TYPE_TO_DEPTH[geometry['type']])
+
+
+def _set_coord_arrays(geometry: dict,
+                      coord_arrays: Iterator[np.ndarray]) -> dict:
+    """Return a new geometry with coordinates taken from coord_arrays."""
+    geom_type = geometry['type']
+    if geom_type == 'GeometryCollection':
+        return {
+            'type':
+            geom_type,
+            'geometries': [
+                _set_coord_arrays(g, coord_arrays)
+                for g in geometry['geometries']
+            ]
+        }
+
+    def rebuild(coords: list, depth: int) -> list:
+        if depth > 1:
+            return [rebuild(c, depth - 1) for c in coords]
+        arr = next(coord_arrays)
+        if depth == 0:
+            return tuple(arr[0].tolist()) if len(arr) > 0 else []
+        return [tuple(c) for c in arr.tolist()]
+
+    coords = rebuild(geometry['coordinates'], _GEOM_TYPE_TO_DEPTH[geom_type])
+    return {'type': geom_type, 'coordinates': coords}
 
 
 def simplify_polygons(geojson: dict) -> dict:
@@ -277,48 +401,138 @@ def simplify_polygons(geojson: dict) -> dict:
     return geojson_split
 
 
+def _is_lut_class_id(class_id: Any) -> bool:
+    """Check if class_id can be looked up in a buffer lookup table."""
+    return (isinstance(class_id, (int, np.integer))
+            and 0 <= class_id < MAX_BUF_LUT_SIZE)
+
+
+def get_buf_lut(class_bufs: Dict[int, Optional[float]],
+                default_buf: Optional[float]) -> np.ndarray:
+    """Convert a class ID --> buffer distance mapping to a lookup table.
+
+    Only integer class IDs in [0, MAX_BUF_LUT_SIZE) are included. Any other
+    class IDs in class_bufs need to be looked up in class_bufs itself.
+
+    Args:
+        class_bufs (Dict[int, Optional[float]]): Mapping from class IDs to
+            buffer distances. A distance of None means no buffering.
+        default_buf (Optional[float]): Buffer distance for class IDs less than
+            the largest one in the lookup table but not in class_bufs.
+
+    Returns:
+        np.ndarray: Float array, ``lut``, such that ``lut[class_id]`` is the
+        buffer distance for class_id, with NaN meaning no buffering. Its length
+        is one more than the largest class ID included.
+    """
+    lut_class_ids = [k for k in class_bufs.keys() if _is_lut_class_id(k)]
+    if len(lut_class_ids) == 0:
+        return np.empty(0, dtype=np.float64)
+    fill = np.nan if default_buf is None else default_buf
+    lut = np.full(max(lut_class_ids) + 1, fill, dtype=np.float64)
+    for class_id in lut_class_ids:
+        buf = class_bufs[class_id]
+        lut[class_id] = np.nan if buf is None else buf
+    return lut
+
+
 def buffer_geoms(geojson: dict,
                  geom_type: str,
-                 class_bufs: Dict[int, Optional[float]] = {},
-                 default_buf: Optional[float] = 1) -> dict:
+                 class_bufs: Optional[Dict[int, Optional[float]]] = None,
+                 default_buf: Optional[float] = 1,
+                 fast_epsilon: Optional[float] = None,
+                 buf_lut: Optional[np.ndarray] = None) -> dict:
     """Buffer geometries.
 
-    Geometries in features without a class_id property will be ignored.
+    Geometries in features without a class_id property are buffered by
+    default_buf. Buffer distances for integer class IDs are looked up for all
+    the features at once using a lookup table (see :func:`.get_buf_lut`);
+    other class IDs are looked up in class_bufs.
 
     Args:
         geojson (dict): A GeoJSON-like mapping of a FeatureCollection.
         geom_type (str): Shapely geometry type to apply the buffering to. Other
             types of geometries will not be affected.
-        class_bufs (Dict[int, Optional[float]]): Optional
+        class_bufs (Optional[Dict[int, Optional[float]]]): Optional
             mapping from class ID to buffer distance (in pixel units) for
-            geom_type geometries.
+            geom_type geometries. If None, default_buf is used for all
+            classes. Defaults to None.
+        default_buf (Optional[float]): Buffer distance for classes not in
+            class_bufs. If None, those geometries are not buffered.
+        fast_epsilon (Optional[float]): If specified and geom_type is
+            "Polygon", polygons with a non-negative buffer distance of at most
+            this value are buffered by inflating their bounding box, computed
+            directly from the GeoJSON coordinates, instead of being converted
+            to shapely geometries and truly buffered. This is exact for
+            axis-aligned rectangles (e.g. grid cells) but otherwise replaces
+            the polygon with its (inflated) envelope. Negative buffer
+            distances always use a true buffer. Defaults to None.
+        buf_lut (Optional[np.ndarray]): Precomputed output of
+            ``get_buf_lut(class_bufs, default_buf)``. If None, it is computed
+            here. Defaults to None.
 
     Returns:
         dict: FeatureCollection with buffered geometries.
     """
 
-    def buffer_geom(geom: 'BaseGeometry',
-                    feature: Optional[dict] = None) -> 'BaseGeometry':
-        has_class_id = (('properties' in feature)
-                        and ('class_id' in feature['properties']))
-        if has_class_id:
-            class_id = feature['properties']['class_id']
-            buf = class_bufs.get(class_id, default_buf)
-        else:
-            buf = default_buf
-
-        # If buf for the class_id was explicitly set as None, don't buffer.
-        if buf is not None:
-            geom = geom.buffer(buf)
+    def get_class_id(feature: dict) -> Any:
+        properties = feature.get('properties') or {}
+        return properties.get('class_id')
 
-        return geom
-
-    all_geom_types = set(f['geometry']['type'] for f in geojson['features'])
-    if geom_type not in all_geom_types:
+    features = [
+        f for f in geojson['features'] if f['geometry']['type'] == geom_type
+    ]
+    if len(features) == 0:
         return geojson
 
-    geojson_buffered = map_geoms(
-        buffer_geom,
+    if buf_lut is None:
+        buf_lut = get_buf_lut(class_bufs or {}, default_buf)
+    class_ids = [get_class_id(f) for f in features]
+    # -1 for class IDs that cannot be looked up in the lookup table
+    lut_class_ids = np.fromiter(
+        (c if _is_lut_class_id(c) else -1 for c in class_ids),
+        dtype=np.int64,
+        count=len(features))
+    # NaN means no buffering, e.g. if buf for the class_id was explicitly set
+    # as None
+    dists = np.full(
+        len(features),
+        np.nan if default_buf is None else default_buf,
+        dtype=np.float64)
+    in_lut = (lut_class_ids >= 0) & (lut_class_ids < len(buf_lut))
+    dists[in_lut] = np.take(buf_lut, lut_class_ids[in_lut])
+    if class_bufs:
+        for i in np.flatnonzero(lut_class_ids < 0):
+            if class_ids[i] is None:
+                continue
+            buf = class_bufs.get(class_ids[i], default_buf)
+            dists[i] = np.nan if buf is None else buf
+
+    use_fast_epsilon = fast_epsilon is not None and geom_type == 'Polygon'
+    # map_features() visits the geom_type features in the same order
+    dists = iter(dists.tolist())
+
+    def buffer_feature(feature: dict) -> dict:
+        dist = next(dists)
+        if np.isnan(dist):
+            return deepcopy(feature)
+        properties = feature.get('properties', {})
+        coords = feature['geometry']['coordinates']
+        # negative buffers (erosion) always use a true buffer
+        if use_fast_epsilon and 0 <= dist <= fast_epsilon and len(coords) > 0:
+            ring = np.array(coords[0], dtype=float)[:, :2]
+            xmin, ymin = (ring.min(axis=0) - dist).tolist()
+            xmax, ymax = (ring.max(axis=0) + dist).tolist()
+            # same as mapping(box(xmin, ymin, xmax, ymax))
+            ring = ((xmax, ymin), (xmax, ymax), (xmin, ymax), (xmin, ymin),
+                    (xmax, ymin))
+            geom_out = {'type': 'Polygon', 'coordinates': (ring, )}
+            return geometry_to_feature(geom_out, properties)
+        geom_out = shape(feature['geometry']).buffer(dist)
+        return geometry_to_feature(mapping(geom_out), properties)
+
+    geojson_buffered = map_features(
+        buffer_feature,
         geojson,
         include_geom_types=[geom_type],
         progressbar_kw=dict(desc=f'Buffering {geom_type}s (if any)'))
@@ -333,16 +547,160 @@ def all_geoms_valid(geojson: dict):
 
 def get_polygons_from_uris(
         uris: Union[str, List[str]],
-        crs_transformer: 'CRSTransformer') -> List['BaseGeometry']:
-    """Load and return polygons (in pixel coords) from one or more URIs."""
+        crs_transformer: 'CRSTransformer',
+        tmp_dir: Optional[str] = None) -> List['BaseGeometry']:
+    """Load and return polygons (in pixel coords) from one or more URIs.
 
-    # use local imports to avoid circular import problems
-    from rastervision.core.data import GeoJSONVectorSource
+    Loaded polygons are memoized, so repeated calls with the same unmodified
+    files and an equivalent ``crs_transformer`` do not re-read and re-parse
+    the files. Files whose modification time cannot be determined (e.g. over
+    HTTP) are not memoized. If there are multiple URIs, they are loaded
+    concurrently in a thread pool.
 
-    polygons = []
+    Args:
+        uris (Union[str, List[str]]): URI or list of URIs of GeoJSON files.
+        crs_transformer (CRSTransformer): A CRS transformer for converting
+            the polygons to pixel coordinates.
+        tmp_dir (Optional[str]): If provided, parsed polygons are also cached
+            on disk in this directory so that other processes sharing it can
+            reuse them. This is only done for CRS transformers whose mapping
+            is fully described by their attributes, i.e.
+            :class:`.RasterioCRSTransformer` and
+            :class:`.IdentityCRSTransformer`. Defaults to None.
+
+    Returns:
+        List[BaseGeometry]: Polygons in pixel coordinates.
+    """
     uris = listify_uris(uris)
-    for uri in uris:
-        source = GeoJSONVectorSource(
-            uri=uri, ignore_crs_field=True, crs_transformer=crs_transformer)
-        polygons += source.get_geoms()
+    unique_uris = list(dict.fromkeys(uris))
+
+    def load(uri: str) -> Tuple['BaseGeometry', ...]:
+        return _load_aoi_geoms(uri, crs_transformer, tmp_dir)
+
+    if len(unique_uris) <= 1:
+        uri_to_geoms = {uri: load(uri) for uri in unique_uris}
+    else:
+        num_workers = min(AOI_MAX_WORKERS, len(unique_uris))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            uri_to_geoms = dict(
+                zip(unique_uris, executor.map(load, unique_uris)))
+
+    polygons = list(chain.from_iterable(uri_to_geoms[uri] for uri in uris))
     return polygons
+
+
+def _crs_transformer_key(crs_transformer: 'CRSTransformer') -> Optional[tuple]:
+    """Return a hashable key identifying the CRS transformer's mapping.
+
+    Only :class:`.RasterioCRSTransformer` and :class:`.IdentityCRSTransformer`
+    instances, whose mapping is fully determined by the attributes below, get
+    a key. Equivalent instances share it and it is stable across processes.
+    Returns None for any other transformer.
+    """
+    # use local imports to avoid circular import problems
+    from rastervision.core.data.crs_transformer import (IdentityCRSTransformer,
+                                                        RasterioCRSTransformer)
+
+    cls = type(crs_transformer)
+    if cls is RasterioCRSTransformer:
+        return (cls.__name__, crs_transformer.transform,
+                str(crs_transformer.image_crs), str(crs_transformer.map_crs),
+                crs_transformer.round_pixels)
+    if cls is IdentityCRSTransformer:
+        return (cls.__name__, )
+    return None
+
+
+def _get_file_version(uri: str) -> Optional[tuple]:
+    """Return a key that changes whenever the file is modified.
+
+    Uses the modification time and size for local files and the last-modified
+    time for remote ones. Returns None if the version cannot be determined.
+    """
+    try:
+        fs = FileSystem.get_file_system(uri, 'r')
+        if issubclass(fs, LocalFileSystem):
+            stat = os.stat(uri)
+            return (stat.st_mtime_ns, stat.st_size)
+        last_modified = fs.last_modified(uri)
+    except Exception:
+        return None
+    if last_modified is None:
+        return None
+    return (str(last_modified), )
+
+
+def _load_aoi_geoms(uri: str,
+                    crs_transformer: 'CRSTransformer',
+                    tmp_dir: Optional[str] = None
+                    ) -> Tuple['BaseGeometry', ...]:
+    """Load polygons from a single URI, using the in-memory and disk caches.
+
+    Cache entries are keyed by the URI, the file's version (see
+    :func:`._get_file_version`) and the CRS transformer (see
+    :func:`._crs_transformer_key`). Transformers without a key are only
+    cached in memory, keyed by their identity. Each cache entry holds a
+    reference to its transformer, so the ID cannot be reused while the entry
+    exists.
+    """
+    file_version = _get_file_version(uri)
+    if file_version is None:
+        return _read_aoi_geoms(uri, crs_transformer)
+
+    crs_transformer_key = _crs_transformer_key(crs_transformer)
+    persistent = crs_transformer_key is not None
+    if not persistent:
+        crs_transformer_key = ('id', id(crs_transformer))
+    key = (uri, file_version, crs_transformer_key)
+    with _aoi_geoms_cache_lock:
+        if key in _aoi_geoms_cache:
+            _aoi_geoms_cache.move_to_end(key)
+            return _aoi_geoms_cache[key][1]
+
+    cache_path = None
+    if tmp_dir is not None and persistent:
+        digest = sha256(repr(key).encode()).hexdigest()
+        cache_path = join(tmp_dir, '.aoi_cache', f'{digest}.pkl')
+
+    if cache_path is not None and isfile(cache_path):
+        with open(cache_path, 'rb') as f:
+            geoms = pickle.load(f)
+    else:
+        geoms = _read_aoi_geoms(uri, crs_transformer)
+        if cache_path is not None:
+            # write to a temp file first so that readers never see a
+            # partially written file
+            make_dir(cache_path, use_dirname=True)
+            tmp_path = f'{cache_path}.{os.getpid()}.{get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(geoms, f)
+            os.replace(tmp_path, cache_path)
+
+    with _aoi_geoms_cache_lock:
+        _aoi_geoms_cache[key] = (crs_transformer, geoms)
+        if len(_aoi_geoms_cache) > AOI_CACHE_SIZE:
+            _aoi_geoms_cache.popitem(last=False)
+    return geoms
+
+
+def _read_aoi_geoms(uri: str, crs_transformer: 'CRSTransformer'
+                    ) -> Tuple['BaseGeometry', ...]:
+    """Read polygons from a single URI and convert them to pixel coords."""
+    # use local imports to avoid circular import problems
+    from rastervision.core.data import GeoJSONVectorSource
+    from rastervision.core.data.vector_source.vector_source import (
+        sanitize_geojson)
+
+    source = GeoJSONVectorSource(
+        uri=uri, ignore_crs_field=True, crs_transformer=crs_transformer)
+    # stream the features and transform them in batches to avoid holding the
+    # entire parsed file in memory
+    features = source.stream_features()
+    geoms = []
+    while True:
+        batch = list(islice(features, AOI_STREAM_BATCH_SIZE))
+        if len(batch) == 0:
+            break
+        geojson = sanitize_geojson(features_to_geojson(batch), crs_transformer)
+        geoms.extend(geojson_to_geoms_stream(geojson['features']))
+    return tuple(geoms)
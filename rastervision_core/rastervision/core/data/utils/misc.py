@@ -87,3 +87,25 @@ def listify_uris(uris: Union[str, List[str]]) -> List[str]:
     else:
         raise TypeError(f'Expected str or List[str], but got {type(uris)}.')
     return uris
+
+
+def morton_encode(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Interleave the bits of x and y to get their Morton (Z-order) codes.
+
+    Args:
+        x (np.ndarray): Integer array of column indices in [0, 2^16).
+        y (np.ndarray): Integer array of row indices in [0, 2^16).
+
+    Returns:
+        np.ndarray: uint32 array of Morton codes.
+    """
+
+    def spread_bits(v: np.ndarray) -> np.ndarray:
+        v = np.asarray(v).astype(np.uint32) & 0x0000FFFF
+        v = (v | (v << 8)) & 0x00FF00FF
+        v = (v | (v << 4)) & 0x0F0F0F0F
+        v = (v | (v << 2)) & 0x33333333
+        v = (v | (v << 1)) & 0x55555555
+        return v
+
+    return spread_bits(x) | (spread_bits(y) << 1)
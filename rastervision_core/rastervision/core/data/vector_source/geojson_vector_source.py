@@ -1,12 +1,28 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List
+import json
+
+import ijson
+import orjson
 
 from rastervision.core.data.vector_source.vector_source import VectorSource
-from rastervision.pipeline.file_system import download_if_needed, file_to_json
+from rastervision.pipeline.file_system import download_if_needed
 
 if TYPE_CHECKING:
     from rastervision.core.data import CRSTransformer, VectorTransformer
 
 
+def _load_json(data: bytes) -> dict:
+    """Parse JSON with orjson, falling back to the json module.
+
+    orjson is faster but stricter: it rejects NaN and Infinity, which
+    ``json.dumps()`` (and hence ``json_to_file()``) writes by default.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
 class GeoJSONVectorSource(VectorSource):
     """A :class:`.VectorSource` for reading GeoJSON files."""
 
@@ -34,9 +50,42 @@ class GeoJSONVectorSource(VectorSource):
         super().__init__(
             crs_transformer, vector_transformers=vector_transformers)
 
+    def stream_features(self) -> Iterator[dict]:
+        """Yield the raw GeoJSON features in the file one at a time.
+
+        If ``ignore_crs_field=True``, the file is parsed incrementally so that
+        only one feature is held in memory at a time. Otherwise, the whole
+        file is loaded so that its CRS field can be checked.
+
+        The incremental parser rejects some input that the json module
+        accepts, such as NaN and Infinity. If it fails partway, the whole
+        file is loaded instead and the features not yet yielded are taken
+        from it.
+
+        Unlike :meth:`.get_geojson`, no transformations are applied to the
+        features.
+        """
+        if not self.ignore_crs_field:
+            yield from self._get_geojson()['features']
+            return
+        # download first so that it gets cached
+        path = download_if_needed(self.uri)
+        num_yielded = 0
+        with open(path, 'rb') as f:
+            try:
+                for feat in ijson.items(f, 'features.item', use_float=True):
+                    yield feat
+                    num_yielded += 1
+            except ijson.JSONError:
+                f.seek(0)
+                features = _load_json(f.read())['features']
+                yield from features[num_yielded:]
+
     def _get_geojson(self):
         # download first so that it gets cached
-        geojson = file_to_json(download_if_needed(self.uri))
+        path = download_if_needed(self.uri)
+        with open(path, 'rb') as f:
+            geojson = _load_json(f.read())
         if not self.ignore_crs_field and 'crs' in geojson:
             raise NotImplementedError(
                 f'The GeoJSON file at {self.uri} contains a CRS field which '
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING, Dict, Optional
 
-from rastervision.core.data.utils.geojson import buffer_geoms
+import numpy as np
+
+from rastervision.core.data.utils.geojson import buffer_geoms, get_buf_lut
 from rastervision.core.data.vector_transformer import VectorTransformer
 
 if TYPE_CHECKING:
@@ -10,10 +12,16 @@ if TYPE_CHECKING:
 class BufferTransformer(VectorTransformer):
     """Buffers geometries."""
 
+    # lookup table for when there are no class_bufs; shared by all instances
+    _EMPTY_LUT = np.empty(0, dtype=np.float64)
+    _EMPTY_LUT.flags.writeable = False
+
     def __init__(self,
                  geom_type: str,
                  class_bufs: Optional[Dict[int, Optional[float]]] = None,
-                 default_buf: Optional[float] = None):
+                 default_buf: Optional[float] = None,
+                 fast_epsilon_buffer: bool = False,
+                 epsilon: float = 1.):
         """Constructor.
 
         Args:
@@ -24,16 +32,34 @@ class BufferTransformer(VectorTransformer):
                 found in the mapping, the value specified by the default_buf
                 field will be used. If the buffer value for a class is None,
                 then no buffering will be applied to the geoms of that
-                class.
-                Defaults to {}.
+                class. If None, default_buf is used for all classes.
+                Defaults to None.
             default_buf (Optional[float], optional): Default buffer to apply to
                 classes not in class_bufs. If None, no buffering will be
                 applied to the geoms of those missing classes. Defaults to
                 None.
+            fast_epsilon_buffer (bool, optional): If True and geom_type is
+                "Polygon", polygons whose buffer is non-negative and at most
+                ``epsilon`` are buffered by inflating their bounding box,
+                computed directly from their coordinates, instead of being
+                converted to shapely geometries and truly buffered. This is
+                exact for axis-aligned rectangles such as grid cells; other
+                polygons are replaced by their inflated envelope. Negative
+                buffers always use a true buffer. Defaults to False.
+            epsilon (float, optional): Largest buffer (in pixels) to which
+                fast_epsilon_buffer applies. Defaults to 1.
         """
         self.geom_type = geom_type
         self.class_bufs = class_bufs if class_bufs is not None else {}
         self.default_buf = default_buf
+        self.fast_epsilon_buffer = fast_epsilon_buffer
+        self.epsilon = epsilon
+        # class ID --> buffer distance lookup table shared by all transform()
+        # calls
+        if len(self.class_bufs) == 0:
+            self._buf_lut = self._EMPTY_LUT
+        else:
+            self._buf_lut = get_buf_lut(self.class_bufs, self.default_buf)
 
     def transform(self,
                   geojson: dict,
@@ -42,4 +68,6 @@ class BufferTransformer(VectorTransformer):
             geojson,
             self.geom_type,
             class_bufs=self.class_bufs,
-            default_buf=self.default_buf)
+            default_buf=self.default_buf,
+            fast_epsilon=self.epsilon if self.fast_epsilon_buffer else None,
+            buf_lut=self._buf_lut)
@@ -32,10 +32,25 @@ class BufferTransformerConfig(VectorTransformerConfig):
         1,
         description='Default buffer to apply to classes not in class_bufs. '
         'If None, no buffering will be applied to the geoms of those classes.')
+    fast_epsilon_buffer: bool = Field(
+        False,
+        description='If True and geom_type is "Polygon", polygons whose '
+        'buffer is non-negative and at most epsilon are buffered by inflating '
+        'their bounding box, computed directly from their coordinates, instead '
+        'of being converted to shapely geometries and truly buffered. This is '
+        'exact for axis-aligned rectangles such as grid cells; other polygons '
+        'are replaced by their inflated envelope. Negative buffers always use '
+        'a true buffer.')
+    epsilon: float = Field(
+        1.,
+        description='Largest buffer (in pixels) to which fast_epsilon_buffer '
+        'applies.')
 
     def build(self, class_config: Optional['ClassConfig'] = None
               ) -> BufferTransformer:
         return BufferTransformer(
             self.geom_type,
             class_bufs=self.class_bufs,
-            default_buf=self.default_buf)
+            default_buf=self.default_buf,
+            fast_epsilon_buffer=self.fast_epsilon_buffer,
+            epsilon=self.epsilon)
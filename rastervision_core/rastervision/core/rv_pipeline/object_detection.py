@@ -120,7 +120,7 @@ def get_train_windows(scene: 'Scene',
 
     def filter_windows(windows):
         if scene.aoi_polygons:
-            windows = Box.filter_by_aoi(windows, scene.aoi_polygons)
+            windows = scene.filter_windows(windows)
         return windows
 
     window_method = chip_opts.window_method
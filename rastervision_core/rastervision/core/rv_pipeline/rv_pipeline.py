@@ -78,7 +78,10 @@ class RVPipeline(Pipeline):
         def build_scene(scene_id: str) -> Scene:
             cfg = scene_id_to_cfg[scene_id]
             scene = cfg.build(
-                class_config, self.tmp_dir, use_transformers=False)
+                class_config,
+                self.tmp_dir,
+                use_transformers=False,
+                build_label_store=False)
             return scene
 
         # build and run each AnalyzerConfig for each scene group
@@ -144,9 +147,13 @@ class RVPipeline(Pipeline):
                         writer.write_sample(sample)
 
             for s in dataset.train_scenes:
-                chip_scene(s.build(class_cfg, self.tmp_dir), TRAIN)
+                scene = s.build(
+                    class_cfg, self.tmp_dir, build_label_store=False)
+                chip_scene(scene, TRAIN)
             for s in dataset.validation_scenes:
-                chip_scene(s.build(class_cfg, self.tmp_dir), VALIDATION)
+                scene = s.build(
+                    class_cfg, self.tmp_dir, build_label_store=False)
+                chip_scene(scene, VALIDATION)
 
     def train(self):
         """Train a model and save it."""
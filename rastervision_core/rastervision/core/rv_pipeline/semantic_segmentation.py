@@ -49,7 +49,7 @@ def get_train_windows(scene: 'Scene',
         """
         total_windows = len(windows)
         if scene.aoi_polygons:
-            windows = Box.filter_by_aoi(windows, scene.aoi_polygons)
+            windows = scene.filter_windows(windows)
             log.info(f'AOI filtering: {len(windows)}/{total_windows} '
                      'chips accepted')
 
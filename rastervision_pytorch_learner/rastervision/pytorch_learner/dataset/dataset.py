@@ -225,7 +225,7 @@ class SlidingWindowGeoDataset(GeoDataset):
             padding=self.padding,
             pad_direction=self.pad_direction)
         if len(self.scene.aoi_polygons) > 0:
-            windows = Box.filter_by_aoi(windows, self.scene.aoi_polygons)
+            windows = self.scene.filter_windows(windows)
         self.windows = windows
 
     def __getitem__(self, idx: int):
@@ -446,7 +446,7 @@ class RandomWindowGeoDataset(GeoDataset):
 
         for _ in range(self.max_sample_attempts):
             window = self._sample_window()
-            if Box.within_aoi(window, self.scene.aoi_polygons):
+            if self.scene.aoi_contains(window):
                 return window
         raise StopIteration('Failed to find random window within scene AOI.')
 
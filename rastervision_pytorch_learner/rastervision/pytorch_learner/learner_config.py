@@ -22,8 +22,8 @@ from rastervision.pipeline.config import (Config, register_config, ConfigError,
 from rastervision.pipeline.file_system import (list_paths, download_if_needed,
                                                unzip, file_exists,
                                                get_local_path, sync_from_dir)
-from rastervision.core.data import (ClassConfig, Scene, DatasetConfig as
-                                    SceneDatasetConfig)
+from rastervision.core.data import (ClassConfig, Scene, SceneConfig,
+                                    DatasetConfig as SceneDatasetConfig)
 from rastervision.pytorch_learner.utils import (
     color_to_triple, validate_albumentation_transform, MinMaxNormalize,
     deserialize_albumentation_transform, get_hubconf_dir_from_cfg,
@@ -1201,23 +1201,30 @@ class GeoDataConfig(DataConfig):
 
     def build_scenes(self, tmp_dir: str
                      ) -> Tuple[List[Scene], List[Scene], List[Scene]]:
-        """Build training, validation, and test scenes."""
+        """Build training, validation, and test scenes.
+
+        The scenes are built without label stores since they are not needed
+        for training.
+        """
         if self.scene_dataset is None:
             raise ValueError('Cannot build scenes if scene_dataset is None.')
 
         class_cfg = self.scene_dataset.class_config
+
+        def build_scene(s: SceneConfig) -> Scene:
+            return s.build(
+                class_cfg,
+                tmp_dir,
+                use_transformers=True,
+                build_label_store=False)
+
         train_scenes = [
-            s.build(class_cfg, tmp_dir, use_transformers=True)
-            for s in self.scene_dataset.train_scenes
+            build_scene(s) for s in self.scene_dataset.train_scenes
         ]
         val_scenes = [
-            s.build(class_cfg, tmp_dir, use_transformers=True)
-            for s in self.scene_dataset.validation_scenes
-        ]
-        test_scenes = [
-            s.build(class_cfg, tmp_dir, use_transformers=True)
-            for s in self.scene_dataset.test_scenes
+            build_scene(s) for s in self.scene_dataset.validation_scenes
         ]
+        test_scenes = [build_scene(s) for s in self.scene_dataset.test_scenes]
 
         return train_scenes, val_scenes, test_scenes
 
@@ -1,8 +1,12 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import rasterio
 
 from rastervision.core.data.crs_transformer import RasterioCRSTransformer
+from rastervision.core.data.crs_transformer.rasterio_crs_transformer import (
+    get_pyproj_transformer)
 from tests import data_file_path
 
 
@@ -23,6 +27,45 @@ class TestRasterioCRSTransformer(unittest.TestCase):
         self.assertAlmostEqual(lon_lat[0], self.lon_lat[0], places=3)
         self.assertAlmostEqual(lon_lat[1], self.lon_lat[1], places=3)
 
+    def test_map_to_pixel_array(self):
+        lons = self.lon_lat[0] + np.linspace(-0.01, 0.01, 5)
+        lats = self.lon_lat[1] + np.linspace(-0.01, 0.01, 5)
+        for round_pixels in [True, False]:
+            tf = RasterioCRSTransformer.from_dataset(
+                self.im_dataset, round_pixels=round_pixels)
+            cols, rows = tf.map_to_pixel((lons, lats))
+            self.assertIsInstance(cols, np.ndarray)
+            for lon, lat, col, row in zip(lons, lats, cols, rows):
+                self.assertEqual(tf.map_to_pixel((lon, lat)), (col, row))
+
+    def test_pixel_to_map_array(self):
+        cols = np.array([0, 50, 100.7])
+        rows = np.array([0, 61, -10.2])
+        for round_pixels in [True, False]:
+            tf = RasterioCRSTransformer.from_dataset(
+                self.im_dataset, round_pixels=round_pixels)
+            lons, lats = tf.pixel_to_map((cols, rows))
+            for col, row, lon, lat in zip(cols, rows, lons, lats):
+                self.assertEqual(tf.pixel_to_map((col, row)), (lon, lat))
+
+    def test_get_pyproj_transformer(self):
+        im_crs = self.im_dataset.crs.wkt
+        tf1 = get_pyproj_transformer(im_crs, 'epsg:4326')
+        tf2 = get_pyproj_transformer(im_crs, 'epsg:4326')
+        self.assertIs(tf1, tf2)
+        self.assertIsNot(
+            get_pyproj_transformer(im_crs, 'epsg:4326', always_xy=False), tf1)
+        self.assertIsNot(get_pyproj_transformer('epsg:4326', im_crs), tf1)
+
+        # shared across threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tfs = list(
+                executor.map(
+                    lambda _: get_pyproj_transformer(im_crs, 'epsg:4326'),
+                    range(8)))
+        for tf in tfs:
+            self.assertIs(tf, tf1)
+
     def test_from_dataset(self):
         # default map_crs
         tf = RasterioCRSTransformer.from_dataset(self.im_dataset)
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from rastervision.core.box import Box
+from rastervision.core.data import (ConstantRasterSourceConfig,
+                                    IdentityCRSTransformer,
+                                    ReclassTransformerConfig)
+
+
+class TestConstantRasterSource(unittest.TestCase):
+    def test_get_chip(self):
+        cfg = ConstantRasterSourceConfig(value=[1, 2, 3], shape=(600, 400))
+        rs = cfg.build()
+        self.assertEqual(rs.extent, Box(0, 0, 600, 400))
+        self.assertEqual(rs.shape, (600, 400, 3))
+        self.assertEqual(rs.dtype, np.uint8)
+        self.assertIsInstance(rs.crs_transformer, IdentityCRSTransformer)
+
+        chip = rs.get_chip(Box(0, 0, 10, 20))
+        self.assertEqual(chip.shape, (10, 20, 3))
+        self.assertEqual(chip.dtype, np.uint8)
+        np.testing.assert_array_equal(chip[5, 5], [1, 2, 3])
+        # chips are views of a single pixel
+        self.assertEqual(chip.strides[:2], (0, 0))
+
+        # overflowing pixels are filled with zeros
+        chip = rs.get_chip(Box(590, 0, 610, 10))
+        self.assertTrue(np.all(chip[:10] == [1, 2, 3]))
+        np.testing.assert_array_equal(chip[10:], 0)
+
+    def test_channel_order_and_transformers(self):
+        cfg = ConstantRasterSourceConfig(
+            value=[1, 2, 3],
+            shape=(100, 100),
+            channel_order=[2, 0],
+            transformers=[ReclassTransformerConfig(mapping={3: 30})],
+            extent=(10, 10, 50, 50))
+        rs = cfg.build()
+        self.assertEqual(rs.shape, (40, 40, 2))
+        chip = rs[:5, :5]
+        self.assertEqual(chip.shape, (5, 5, 2))
+        np.testing.assert_array_equal(chip[0, 0], [30, 1])
+
+        rs = cfg.build(use_transformers=False)
+        np.testing.assert_array_equal(rs[:5, :5][0, 0], [3, 1])
+        np.testing.assert_array_equal(
+            rs.get_raw_chip(Box(0, 0, 1, 1))[0, 0], [1, 2, 3])
+
+    def test_scalar_value(self):
+        cfg = ConstantRasterSourceConfig(
+            value=0.5, shape=(10, 10), dtype='float32')
+        rs = cfg.build()
+        self.assertEqual(rs.num_channels, 1)
+        self.assertEqual(rs.dtype, np.float32)
+        np.testing.assert_array_equal(rs.get_image_array(),
+                                      np.full((10, 10, 1), 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -148,6 +148,81 @@ class TestMultiRasterSource(unittest.TestCase):
         self.assertEqual(
             tuple(chip.reshape(-1, 3).mean(axis=0)), (100, 100, 100))
 
+    def test_shared_reads(self):
+        path = data_file_path('multi_raster_source/const_100_600x600.tiff')
+        source_1 = RasterioSourceConfig(uris=[path], channel_order=[0])
+        source_2 = RasterioSourceConfig(
+            uris=[path],
+            channel_order=[0],
+            transformers=[ReclassTransformerConfig(mapping={100: 175})])
+        source_3 = RasterioSourceConfig(
+            uris=[path],
+            channel_order=[0],
+            transformers=[ReclassTransformerConfig(mapping={100: 250})])
+        cfg = MultiRasterSourceConfig(
+            raster_sources=[source_1, source_2, source_3])
+        rs = cfg.build(tmp_dir=self.tmp_dir)
+        key = rs.read_keys[0]
+        self.assertIsNotNone(key)
+        self.assertListEqual(rs.read_keys, [key, key, key])
+
+        # no shared reads between different files
+        rs_diverse = make_cfg_diverse().build(tmp_dir=self.tmp_dir)
+        self.assertListEqual(rs_diverse.read_keys, [None, None, None])
+
+        num_reads = []
+        for sub_rs in rs.raster_sources:
+            _get_chip = sub_rs._get_chip
+
+            def counted_get_chip(*args, _get_chip=_get_chip, **kwargs):
+                num_reads.append(1)
+                return _get_chip(*args, **kwargs)
+
+            sub_rs._get_chip = counted_get_chip
+
+        window = Box(0, 0, 100, 100)
+        chip = rs.get_chip(window)
+        self.assertEqual(len(num_reads), 1)
+        self.assertEqual(
+            tuple(chip.reshape(-1, 3).mean(axis=0)), (100, 175, 250))
+
+    def test_stacked_lut(self):
+        path = data_file_path('multi_raster_source/const_100_600x600.tiff')
+        values = [175, 250, 3, 100]
+        rs_cfgs = [
+            RasterioSourceConfig(
+                uris=[path],
+                channel_order=[0],
+                transformers=[ReclassTransformerConfig(mapping={100: v})])
+            for v in values
+        ]
+        cfg = MultiRasterSourceConfig(
+            raster_sources=rs_cfgs, channel_order=[3, 0, 2])
+        rs = cfg.build(tmp_dir=self.tmp_dir)
+        self.assertIsNotNone(rs.stacked_lut)
+        self.assertEqual(rs.stacked_lut.shape, (256, len(values)))
+
+        window = Box(0, 0, 100, 100)
+        chip = rs.get_chip(window)
+        self.assertEqual(chip.shape, (100, 100, 3))
+        self.assertEqual(chip.dtype, np.uint8)
+        self.assertEqual(
+            tuple(chip.reshape(-1, 3).mean(axis=0)), (100, 175, 3))
+        # same result as transforming each sub-chip separately
+        sub_chips = rs._get_sub_chips(window, raw=False)
+        expected = np.concatenate(sub_chips, axis=-1)[..., [3, 0, 2]]
+        np.testing.assert_array_equal(chip, expected)
+
+        # not applicable if sub-RasterSources read different data or have
+        # other transformers
+        rs = make_cfg_diverse().build(tmp_dir=self.tmp_dir)
+        self.assertIsNone(rs.stacked_lut)
+        cfg.raster_sources[0].transformers = [
+            CastTransformerConfig(to_dtype='uint8')
+        ]
+        rs = cfg.build(tmp_dir=self.tmp_dir)
+        self.assertIsNone(rs.stacked_lut)
+
     def test_nonidentical_extents_and_resolutions(self):
         cfg = make_cfg_diverse(diff_dtypes=False)
         rs = cfg.build(tmp_dir=self.tmp_dir)
@@ -0,0 +1,28 @@
+import unittest
+
+import numpy as np
+
+from rastervision.core.data.raster_transformer import ReclassTransformerConfig
+
+
+class TestReclassTransformer(unittest.TestCase):
+    def test_transform(self):
+        tf = ReclassTransformerConfig(mapping={1: 2, 2: 3, 300: 0}).build()
+        for dtype in [np.uint8, np.uint16, np.int32, np.float32]:
+            in_chip = np.array([[[0], [1]], [[2], [3]]], dtype=dtype)
+            out_chip = tf.transform(in_chip.copy())
+            self.assertEqual(out_chip.dtype, dtype)
+            np.testing.assert_array_equal(out_chip.ravel(), [0, 2, 3, 3])
+
+    def test_get_lut(self):
+        tf = ReclassTransformerConfig(mapping={1: 2}).build()
+        lut = tf.get_lut(np.uint8)
+        self.assertEqual(len(lut), 256)
+        self.assertEqual(lut[1], 2)
+        self.assertIs(tf.get_lut(np.uint8), lut)
+        self.assertEqual(len(tf.get_lut(np.uint16)), 65536)
+        self.assertIsNone(tf.get_lut(np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+from os.path import join
+
+import numpy as np
+from shapely.geometry import Polygon
+
+from rastervision.pipeline.file_system import get_tmp_dir
+from rastervision.core.box import Box
+from rastervision.core.data import (
+    ClassConfig, ClassInferenceTransformerConfig, GeoJSONVectorSourceConfig,
+    ObjectDetectionGeoJSONStoreConfig, RasterioSourceConfig,
+    RasterizedSourceConfig, RasterizerConfig, SceneConfig, Scene,
+    SemanticSegmentationLabelSourceConfig, SemanticSegmentationLabelSource,
+    SemanticSegmentationLabelStoreConfig, SemanticSegmentationLabelStore)
+from rastervision.core.data.scene import AOI_GRID_LEVEL
+from rastervision.core.data.utils import morton_encode
+from tests import data_file_path
+from tests.core.data.mock_raster_source import MockRasterSource
+
+
+class TestScene(unittest.TestCase):
+    def setUp(self):
+        self.class_config = ClassConfig(names=['bg', 'fg'])
+        self.path = data_file_path(
+            'multi_raster_source/const_100_600x600.tiff')
+
+    def test_lazy_build(self):
+        num_calls = []
+
+        def build_raster_source():
+            num_calls.append(1)
+            return RasterioSourceConfig(uris=[self.path]).build(self.tmp_dir)
+
+        with get_tmp_dir() as self.tmp_dir:
+            scene = Scene('s', build_raster_source)
+            self.assertEqual(len(num_calls), 0)
+            self.assertEqual(scene.extent, Box(0, 0, 600, 600))
+            _ = scene.raster_source
+            self.assertEqual(len(num_calls), 1)
+
+    def test_callable_source_not_built(self):
+        class CallableRasterSource(MockRasterSource):
+            def __call__(self):
+                raise AssertionError('should not be called')
+
+        rs = CallableRasterSource(channel_order=[0], num_channels_raw=1)
+        scene = Scene('s', rs)
+        self.assertIs(scene.raster_source, rs)
+
+    def test_scene_config_build(self):
+        rs_cfg = RasterioSourceConfig(uris=[self.path])
+        scene_cfg = SceneConfig(
+            id='s',
+            raster_source=rs_cfg,
+            label_source=SemanticSegmentationLabelSourceConfig(
+                raster_source=rs_cfg))
+        with get_tmp_dir() as tmp_dir:
+            scene = scene_cfg.build(self.class_config, tmp_dir)
+            self.assertIsNone(scene.label_store)
+            self.assertIsInstance(scene.label_source,
+                                  SemanticSegmentationLabelSource)
+            self.assertEqual(scene.label_source.extent,
+                             scene.raster_source.extent)
+
+    def test_scene_config_build_no_label_store(self):
+        rs_cfg = RasterioSourceConfig(uris=[self.path])
+        scene_cfg = SceneConfig(
+            id='s',
+            raster_source=rs_cfg,
+            label_source=SemanticSegmentationLabelSourceConfig(
+                raster_source=rs_cfg),
+            label_store=SemanticSegmentationLabelStoreConfig())
+        with get_tmp_dir() as tmp_dir:
+            scene_cfg.label_store.uri = join(tmp_dir, 'labels')
+            scene = scene_cfg.build(self.class_config, tmp_dir)
+            self.assertIsInstance(scene.label_store,
+                                  SemanticSegmentationLabelStore)
+            scene = scene_cfg.build(
+                self.class_config, tmp_dir, build_label_store=False)
+            self.assertIsNone(scene.label_store)
+            self.assertIsInstance(scene.label_source,
+                                  SemanticSegmentationLabelSource)
+
+    def test_scene_config_build_shared_crs_transformer(self):
+        vs_cfg = GeoJSONVectorSourceConfig(
+            uri=data_file_path('bboxes.geojson'),
+            transformers=[ClassInferenceTransformerConfig(default_class_id=1)])
+        scene_cfg = SceneConfig(
+            id='s',
+            raster_source=RasterioSourceConfig(uris=[self.path]),
+            label_source=SemanticSegmentationLabelSourceConfig(
+                raster_source=RasterizedSourceConfig(
+                    vector_source=vs_cfg,
+                    rasterizer_config=RasterizerConfig(
+                        background_class_id=0))),
+            label_store=ObjectDetectionGeoJSONStoreConfig())
+        with get_tmp_dir() as tmp_dir:
+            scene_cfg.label_store.uri = join(tmp_dir, 'labels.json')
+            scene = scene_cfg.build(self.class_config, tmp_dir)
+            crs_transformer = scene.raster_source.crs_transformer
+            self.assertIs(scene.label_source.raster_source.crs_transformer,
+                          crs_transformer)
+            self.assertIs(scene.label_store.crs_transformer, crs_transformer)
+
+            with self.assertRaises(ValueError):
+                scene_cfg.label_store.build(self.class_config, None, None,
+                                            tmp_dir)
+
+    def test_aoi_contains(self):
+        aoi_polygons = [
+            Polygon.from_bounds(0, 0, 10, 10),
+            Polygon.from_bounds(20, 20, 40, 40)
+        ]
+        scene = Scene('s', None, aoi_polygons=aoi_polygons)
+        self.assertTrue(scene.aoi_contains(Box(0, 0, 5, 5)))
+        self.assertTrue(scene.aoi_contains(Box(25, 25, 30, 30)))
+        self.assertFalse(scene.aoi_contains(Box(5, 5, 15, 15)))
+        self.assertTrue(scene.aoi_contains(Box(5, 5, 15, 15), within=False))
+        self.assertFalse(scene.aoi_contains(Box(50, 50, 60, 60), within=False))
+
+        self.assertFalse(scene.aoi_contains(Box(8, 8, 22, 22)))
+        self.assertFalse(scene.aoi_contains(Box(-5, -5, 5, 5)))
+
+        # index is updated when the AOI polygons change
+        scene.aoi_polygons = [Polygon.from_bounds(50, 50, 60, 60)]
+        self.assertTrue(scene.aoi_contains(Box(50, 50, 60, 60)))
+
+        # no AOI
+        scene = Scene('s', None)
+        self.assertIsNone(scene.aoi_index)
+        self.assertTrue(scene.aoi_contains(Box(50, 50, 60, 60)))
+
+    def test_filter_windows(self):
+        aoi_polygons = [
+            Polygon.from_bounds(0, 0, 10, 10),
+            Polygon.from_bounds(20, 20, 40, 40),
+            Polygon([(50, 50), (80, 50), (50, 80)])
+        ]
+        scene = Scene('s', None, aoi_polygons=aoi_polygons)
+        windows = [
+            Box(0, 0, 5, 5),
+            Box(25, 25, 30, 30),
+            Box(5, 5, 15, 15),
+            # corners in AOI grid cells but not within an AOI polygon
+            Box(8, 8, 22, 22),
+            Box(70, 70, 78, 78),
+            # outside the grid
+            Box(-5, -5, 5, 5),
+            Box(100, 100, 110, 110),
+            Box(50, 50, 55, 55),
+        ]
+        for within in [True, False]:
+            expected = [
+                w for w in windows if scene.aoi_contains(w, within=within)
+            ]
+            self.assertListEqual(
+                scene.filter_windows(windows, within=within), expected)
+        self.assertListEqual(
+            scene.filter_windows(windows),
+            [Box(0, 0, 5, 5),
+             Box(25, 25, 30, 30),
+             Box(50, 50, 55, 55)])
+        self.assertListEqual(scene.filter_windows([]), [])
+
+        # no AOI
+        scene = Scene('s', None)
+        self.assertListEqual(scene.filter_windows(windows), windows)
+
+    def test_aoi_grid(self):
+        # many long diagonal polygons whose envelopes span the whole AOI
+        aoi_polygons = [
+            Polygon([(i, 0), (i + 1, 0), (1000 + i, 1000), (999 + i, 1000)])
+            for i in range(0, 1000, 10)
+        ]
+        scene = Scene('s', None, aoi_polygons=aoi_polygons)
+        codes, to_cells = scene._build_aoi_grid()
+        n = 2**AOI_GRID_LEVEL
+        # the union of the envelopes covers every cell exactly once
+        self.assertEqual(len(codes), n * n)
+        self.assertTrue(np.all(np.diff(codes.astype(np.int64)) > 0))
+
+        # matches a cell-by-cell computation
+        aoi_polygons = [
+            Polygon.from_bounds(0, 0, 10, 10),
+            Polygon.from_bounds(5, 20, 40, 40),
+            Polygon.from_bounds(30, 0, 40, 8)
+        ]
+        scene = Scene('s', None, aoi_polygons=aoi_polygons)
+        codes, to_cells = scene._build_aoi_grid()
+        expected = set()
+        for p in aoi_polygons:
+            xmin, ymin, xmax, ymax = p.bounds
+            (c0, c1), (r0, r1), _ = to_cells(
+                np.array([xmin, xmax]), np.array([ymin, ymax]))
+            for r in range(r0, r1 + 1):
+                for c in range(c0, c1 + 1):
+                    expected.add(int(morton_encode(c, r)))
+        self.assertListEqual(codes.tolist(), sorted(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
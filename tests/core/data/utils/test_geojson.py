@@ -1,13 +1,21 @@
 import unittest
+from unittest.mock import patch
+import os
 
 import numpy as np
 from shapely.geometry import (Polygon, MultiPolygon, Point, MultiPoint,
-                              LineString, MultiLineString, mapping, shape)
+                              LineString, MultiLineString, GeometryCollection,
+                              mapping, shape)
+from shapely.affinity import scale
 
 from rastervision.core.data.utils import (
     geometry_to_feature, geometries_to_geojson, is_empty_feature,
     remove_empty_features, split_multi_geometries, map_to_pixel_coords,
-    pixel_to_map_coords, buffer_geoms, all_geoms_valid)
+    pixel_to_map_coords, buffer_geoms, get_buf_lut, all_geoms_valid,
+    get_polygons_from_uris, geojson_to_geoms_stream, transform_geojson_coords,
+    geoms_to_geojson)
+from rastervision.pipeline.file_system import get_tmp_dir, json_to_file
+from rastervision.core.data import IdentityCRSTransformer
 from tests.core.data.mock_crs_transformer import DoubleCRSTransformer
 
 
@@ -101,6 +109,51 @@ class TestGeojsonUtils(unittest.TestCase):
         coords_out = np.array(geom_out)
         np.testing.assert_array_almost_equal(coords_out, coords_in / 2)
 
+    def test_transform_geojson_coords(self):
+        geoms = [
+            Point(1, 2),
+            MultiPoint([(1, 2), (3, 4)]),
+            LineString([(0, 0), (1, 1)]),
+            MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]),
+            Polygon.from_bounds(0, 0, 10, 10).difference(
+                Polygon.from_bounds(2, 2, 4, 4)),
+            MultiPolygon([
+                Polygon.from_bounds(0, 0, 1, 1),
+                Polygon.from_bounds(2, 2, 3, 3)
+            ]),
+            GeometryCollection([Point(1, 2),
+                                LineString([(0, 0), (1, 1)])]),
+            Point(1, 2, 3),
+        ]
+        properties = [{'i': i} for i in range(len(geoms))]
+        geojson_in = geoms_to_geojson(geoms, properties)
+        num_calls = []
+
+        def func(xy):
+            num_calls.append(1)
+            xs, ys = xy
+            return xs * 2, ys * 3
+
+        geojson_out = transform_geojson_coords(geojson_in, func)
+        self.assertEqual(len(num_calls), 1)
+        features_out = geojson_out['features']
+        self.assertEqual(len(features_out), len(geoms))
+        for geom, props, f_out in zip(geoms, properties, features_out):
+            geom_exp = scale(geom, xfact=2, yfact=3, origin=(0, 0))
+            self.assertTrue(shape(f_out['geometry']).equals(geom_exp))
+            self.assertFalse(shape(f_out['geometry']).has_z)
+            self.assertDictEqual(f_out['properties'], props)
+
+        # no coordinates
+        geojson_out = transform_geojson_coords(
+            geometries_to_geojson([{
+                'type': 'Point',
+                'coordinates': []
+            }]), func)
+        self.assertEqual(len(num_calls), 1)
+        self.assertListEqual(
+            geojson_out['features'][0]['geometry']['coordinates'], [])
+
     def test_simplify_polygons(self):
         """The buffer(0) trick in simplify_polygons() doesn't always work."""
         pass
@@ -148,6 +201,164 @@ class TestGeojsonUtils(unittest.TestCase):
         geom_out = shape(geojson_out['features'][0]['geometry'])
         self.assertTrue(geom_out.equals(geom_in.buffer(5)))
 
+    def test_buffer_geoms_mixed(self):
+        class_bufs = {0: 5, 1: None}
+        geoms_in = [
+            Point(0, 0),
+            Point(10, 10),
+            Point(20, 20),
+            Point(30, 30),
+            Polygon.from_bounds(0, 0, 10, 10)
+        ]
+        properties = [
+            dict(class_id=0),
+            dict(class_id=1),
+            dict(class_id=2),
+            dict(),
+            dict(class_id=0)
+        ]
+        feats_in = [
+            geometry_to_feature(mapping(g), p)
+            for g, p in zip(geoms_in, properties)
+        ]
+        geojson_in = geometries_to_geojson(feats_in)
+        geojson_out = buffer_geoms(
+            geojson_in,
+            geom_type='Point',
+            class_bufs=class_bufs,
+            default_buf=2)
+        geoms_out = [shape(f['geometry']) for f in geojson_out['features']]
+        self.assertTrue(geoms_out[0].equals(geoms_in[0].buffer(5)))
+        self.assertTrue(geoms_out[1].equals(geoms_in[1]))
+        self.assertTrue(geoms_out[2].equals(geoms_in[2].buffer(2)))
+        self.assertTrue(geoms_out[3].equals(geoms_in[3].buffer(2)))
+        self.assertTrue(geoms_out[4].equals(geoms_in[4]))
+        props_out = [f['properties'] for f in geojson_out['features']]
+        self.assertListEqual(props_out, properties)
+
+    def test_get_buf_lut(self):
+        lut = get_buf_lut({0: 5, 1: None, 3: 1}, default_buf=2)
+        np.testing.assert_array_equal(lut, [5, np.nan, 2, 1])
+        lut = get_buf_lut({0: 5}, default_buf=None)
+        np.testing.assert_array_equal(lut, [5])
+        self.assertEqual(len(get_buf_lut({}, default_buf=2)), 0)
+        # class IDs that are not small non-negative ints are left out
+        lut = get_buf_lut({-1: 5, 10**9: 5, 'a': 5, 1.5: 5, 1: 3}, None)
+        np.testing.assert_array_equal(lut, [np.nan, 3])
+
+    def test_buffer_geoms_non_lut_class_ids(self):
+        class_bufs = {1: 5, 1.5: 3, 'a': 4, 10**9: 6, -1: None}
+        class_ids = [1, 1.7, 1.5, 'a', 10**9, -1, 'b', 2]
+        feats_in = [
+            geometry_to_feature(mapping(Point(0, 0)), dict(class_id=c))
+            for c in class_ids
+        ]
+        geojson_out = buffer_geoms(
+            geometries_to_geojson(feats_in),
+            geom_type='Point',
+            class_bufs=class_bufs,
+            default_buf=2)
+        geoms_out = [shape(f['geometry']) for f in geojson_out['features']]
+        # same as looking up each class ID in class_bufs
+        for c, geom_out in zip(class_ids, geoms_out):
+            buf = class_bufs.get(c, 2)
+            geom_expected = Point(0, 0) if buf is None else Point(
+                0, 0).buffer(buf)
+            self.assertTrue(geom_out.equals(geom_expected), msg=c)
+
+    def test_get_polygons_from_uris_cached(self):
+        polygon = Polygon.from_bounds(0, 0, 10, 10)
+        with get_tmp_dir() as tmp_dir:
+            uri = os.path.join(tmp_dir, 'aoi.json')
+            json_to_file(geometries_to_geojson([mapping(polygon)]), uri)
+            cache_dir = os.path.join(tmp_dir, '.aoi_cache')
+
+            # transformers without a key are cached in memory by identity
+            crs_transformer = DoubleCRSTransformer()
+            polygons = get_polygons_from_uris(
+                uri, crs_transformer, tmp_dir=tmp_dir)
+            self.assertEqual(len(polygons), 1)
+            self.assertTrue(polygons[0].equals(
+                Polygon.from_bounds(0, 0, 20, 20)))
+            self.assertFalse(os.path.exists(cache_dir))
+            with patch('rastervision.core.data.utils.geojson._read_aoi_geoms'
+                       ) as mock_read:
+                get_polygons_from_uris(uri, crs_transformer)
+                mock_read.assert_not_called()
+                get_polygons_from_uris(uri, DoubleCRSTransformer())
+                mock_read.assert_called_once()
+
+            # equivalent transformers with a key share the disk cache
+            polygons = get_polygons_from_uris(
+                uri, IdentityCRSTransformer(), tmp_dir=tmp_dir)
+            self.assertTrue(polygons[0].equals(polygon))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            polygons_cached = get_polygons_from_uris(
+                [uri], IdentityCRSTransformer(), tmp_dir=tmp_dir)
+            self.assertTrue(polygons_cached[0].equals(polygon))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # modifying the file invalidates the cached result
+            polygon_2 = Polygon.from_bounds(0, 0, 5, 5)
+            json_to_file(
+                geometries_to_geojson([mapping(polygon_2),
+                                       mapping(polygon_2)]), uri)
+            polygons = get_polygons_from_uris(
+                uri, IdentityCRSTransformer(), tmp_dir=tmp_dir)
+            self.assertEqual(len(polygons), 2)
+            self.assertTrue(polygons[0].equals(polygon_2))
+            polygons = get_polygons_from_uris(uri, crs_transformer)
+            self.assertEqual(len(polygons), 2)
+            self.assertTrue(polygons[0].equals(
+                Polygon.from_bounds(0, 0, 10, 10)))
+
+    def test_get_polygons_from_uris_multiple(self):
+        crs_transformer = DoubleCRSTransformer()
+        polygons_in = [
+            Polygon.from_bounds(0, 0, 10, 10),
+            Polygon.from_bounds(20, 20, 30, 30),
+            Polygon.from_bounds(40, 40, 50, 50)
+        ]
+        with get_tmp_dir() as tmp_dir:
+            uris = [os.path.join(tmp_dir, f'{i}.json') for i in range(3)]
+            for uri, polygon in zip(uris, polygons_in):
+                json_to_file(geometries_to_geojson([mapping(polygon)]), uri)
+            polygons = get_polygons_from_uris(uris + uris[:1], crs_transformer)
+            self.assertEqual(len(polygons), 4)
+            polygons_expected = [
+                crs_transformer.map_to_pixel(p)
+                for p in polygons_in + polygons_in[:1]
+            ]
+            for p, p_expected in zip(polygons, polygons_expected):
+                self.assertTrue(p.equals(p_expected))
+
+    def test_get_polygons_from_uris_batched(self):
+        crs_transformer = DoubleCRSTransformer()
+        polygons_in = [
+            Polygon.from_bounds(i * 10, i * 10, i * 10 + 5, i * 10 + 5)
+            for i in range(5)
+        ]
+        geoms_in = [MultiPolygon(polygons_in[:2]), *polygons_in[2:]]
+        with get_tmp_dir() as tmp_dir:
+            uri = os.path.join(tmp_dir, 'aoi_batched.json')
+            json_to_file(
+                geometries_to_geojson([mapping(g) for g in geoms_in]), uri)
+            with patch(
+                    'rastervision.core.data.utils.geojson.AOI_STREAM_BATCH_SIZE',
+                    2):
+                polygons = get_polygons_from_uris(uri, crs_transformer)
+        self.assertEqual(len(polygons), 5)
+        for p, p_in in zip(polygons, polygons_in):
+            self.assertTrue(p.equals(crs_transformer.map_to_pixel(p_in)))
+
+    def test_geojson_to_geoms_stream(self):
+        geoms = [Point(0, 0), Polygon.from_bounds(0, 0, 1, 1)]
+        features = (geometry_to_feature(mapping(g)) for g in geoms)
+        geoms_out = geojson_to_geoms_stream(features)
+        self.assertNotIsInstance(geoms_out, list)
+        for g, g_out in zip(geoms, geoms_out):
+            self.assertTrue(g.equals(g_out))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+import numpy as np
+
+from rastervision.core.data.utils import morton_encode
+
+
+class TestMiscUtils(unittest.TestCase):
+    def test_morton_encode(self):
+        x = np.array([0, 1, 0, 1, 2, 3, 65535])
+        y = np.array([0, 0, 1, 1, 0, 3, 65535])
+        codes = morton_encode(x, y)
+        self.assertEqual(codes.dtype, np.uint32)
+        np.testing.assert_array_equal(codes, [0, 1, 2, 3, 4, 15, 2**32 - 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
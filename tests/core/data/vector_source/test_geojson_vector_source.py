@@ -1,11 +1,13 @@
 import unittest
 import os
+import math
 
 from shapely.geometry import shape
 
 from rastervision.core.data import (
-    GeoJSONVectorSourceConfig, ClassConfig, IdentityCRSTransformer,
-    ClassInferenceTransformerConfig, BufferTransformerConfig)
+    GeoJSONVectorSource, GeoJSONVectorSourceConfig, ClassConfig,
+    IdentityCRSTransformer, ClassInferenceTransformerConfig,
+    BufferTransformerConfig)
 from rastervision.pipeline.file_system import json_to_file, get_tmp_dir
 
 from tests.core.data.mock_crs_transformer import DoubleCRSTransformer
@@ -139,6 +141,95 @@ class TestGeoJSONVectorSource(unittest.TestCase):
         trans_geom = trans_geojson['features'][0]['geometry']
         self.assertTrue(shape(geom).equals(shape(trans_geom)))
 
+    def test_stream_features(self):
+        geojson = {
+            'type':
+            'FeatureCollection',
+            'crs': {
+                'type': 'name',
+                'properties': {
+                    'name': 'EPSG:4326'
+                }
+            },
+            'features': [{
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [i + 0.5, i]
+                },
+                'properties': {
+                    'id': i
+                }
+            } for i in range(3)]
+        }
+        json_to_file(geojson, self.uri)
+
+        source = GeoJSONVectorSource(
+            self.uri, IdentityCRSTransformer(), ignore_crs_field=True)
+        features = list(source.stream_features())
+        self.assertListEqual(features, geojson['features'])
+        self.assertIsInstance(features[0]['geometry']['coordinates'][0], float)
+
+        # the CRS field is still checked if not ignored
+        source = GeoJSONVectorSource(self.uri, IdentityCRSTransformer())
+        with self.assertRaises(NotImplementedError):
+            list(source.stream_features())
+
+    def test_get_geojson_nan(self):
+        # json_to_file() writes NaN as is, which orjson does not accept
+        geojson = {
+            'type':
+            'FeatureCollection',
+            'features': [{
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [0.5, 0.5]
+                },
+                'properties': {
+                    'score': float('nan')
+                }
+            }]
+        }
+        json_to_file(geojson, self.uri)
+        source = GeoJSONVectorSource(self.uri, IdentityCRSTransformer())
+        geojson_out = source._get_geojson()
+        props = geojson_out['features'][0]['properties']
+        self.assertTrue(math.isnan(props['score']))
+
+    def test_stream_features_nan(self):
+        # the incremental parser rejects NaN; should fall back to json
+        geojson = {
+            'type':
+            'FeatureCollection',
+            'features': [{
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [0.5, 0.5]
+                },
+                'properties': {
+                    'score': 1.
+                }
+            }, {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [1.5, 1.5]
+                },
+                'properties': {
+                    'score': float('nan')
+                }
+            }]
+        }
+        json_to_file(geojson, self.uri)
+        source = GeoJSONVectorSource(
+            self.uri, IdentityCRSTransformer(), ignore_crs_field=True)
+        feats = list(source.stream_features())
+        self.assertEqual(len(feats), 2)
+        self.assertEqual(feats[0]['properties']['score'], 1.)
+        self.assertTrue(math.isnan(feats[1]['properties']['score']))
+
 
 if __name__ == '__main__':
     unittest.main()
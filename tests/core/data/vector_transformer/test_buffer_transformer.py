@@ -1,6 +1,6 @@
 import unittest
 
-from shapely.geometry import (Polygon, Point, LineString, mapping, shape)
+from shapely.geometry import (Polygon, Point, LineString, box, mapping, shape)
 
 from rastervision.core.data.vector_transformer import BufferTransformer
 from rastervision.core.data.utils import (geometry_to_feature,
@@ -52,6 +52,98 @@ class TestBufferTransformer(unittest.TestCase):
         geom_out = shape(geojson_out['features'][0]['geometry'])
         self.assertTrue(geom_out.equals(geom_in))
 
+    def test_no_class_bufs(self):
+        tf1 = BufferTransformer(geom_type='Point', default_buf=2)
+        tf2 = BufferTransformer(geom_type='Point', class_bufs={})
+        self.assertEqual(tf1.class_bufs, {})
+        self.assertIsNot(tf1.class_bufs, tf2.class_bufs)
+        self.assertIs(tf1._buf_lut, tf2._buf_lut)
+
+        geom_in = Point(0, 0)
+        feat_in = geometry_to_feature(mapping(geom_in), dict(class_id=0))
+        geojson_out = tf1(geometries_to_geojson([feat_in]))
+        geom_out = shape(geojson_out['features'][0]['geometry'])
+        self.assertTrue(geom_out.equals(geom_in.buffer(2)))
+
+    def test_transform_fast_epsilon_buffer(self):
+        tf = BufferTransformer(
+            geom_type='Polygon',
+            class_bufs={
+                0: 0.5,
+                1: 5
+            },
+            fast_epsilon_buffer=True,
+            epsilon=1)
+        geom_in = Polygon.from_bounds(0, 0, 10, 10)
+        feats_in = [
+            geometry_to_feature(mapping(geom_in), dict(class_id=i))
+            for i in [0, 1, 2]
+        ]
+        geojson_in = geometries_to_geojson(feats_in)
+        geojson_out = tf(geojson_in)
+        geoms_out = [shape(f['geometry']) for f in geojson_out['features']]
+        # small buffer: bounding box is inflated
+        self.assertTrue(geoms_out[0].equals(box(-0.5, -0.5, 10.5, 10.5)))
+        # large buffer: regular buffering
+        self.assertTrue(geoms_out[1].equals(geom_in.buffer(5)))
+        # no buffer
+        self.assertTrue(geoms_out[2].equals(geom_in))
+
+    def test_transform_fast_epsilon_buffer_all_small(self):
+        tf = BufferTransformer(
+            geom_type='Polygon',
+            class_bufs={0: 0.5},
+            fast_epsilon_buffer=True,
+            epsilon=1)
+        for num_feats in [1, 2, 3]:
+            geoms_in = [
+                Polygon.from_bounds(i, i, i + 10, i + 10)
+                for i in range(num_feats)
+            ]
+            feats_in = [
+                geometry_to_feature(mapping(g), dict(class_id=0))
+                for g in geoms_in
+            ]
+            geojson_out = tf(geometries_to_geojson(feats_in))
+            geoms_out = [shape(f['geometry']) for f in geojson_out['features']]
+            for i, geom_out in enumerate(geoms_out):
+                self.assertTrue(
+                    geom_out.equals(box(i - 0.5, i - 0.5, i + 10.5, i + 10.5)))
+
+    def test_transform_fast_epsilon_buffer_envelope(self):
+        tf = BufferTransformer(
+            geom_type='Polygon',
+            class_bufs={0: 1},
+            fast_epsilon_buffer=True,
+            epsilon=1)
+        geom_in = Polygon([(0, 0), (10, 5), (4, 12)], [[(3, 3), (5, 4),
+                                                        (4, 6)]])
+        feat_in = geometry_to_feature(mapping(geom_in), dict(class_id=0))
+        geojson_out = tf(geometries_to_geojson([feat_in]))
+        geom_dict_out = geojson_out['features'][0]['geometry']
+        # same output as buffering the shapely envelope
+        self.assertEqual(geom_dict_out, mapping(box(-1, -1, 11, 13)))
+
+    def test_transform_fast_epsilon_buffer_negative(self):
+        tf = BufferTransformer(
+            geom_type='Polygon',
+            class_bufs={
+                0: -2,
+                1: -0.25
+            },
+            fast_epsilon_buffer=True,
+            epsilon=1)
+        feats_in = [
+            geometry_to_feature(
+                mapping(Polygon.from_bounds(0, 0, 1, 1)), dict(class_id=i))
+            for i in [0, 1]
+        ]
+        geojson_out = tf(geometries_to_geojson(feats_in))
+        geoms_out = [shape(f['geometry']) for f in geojson_out['features']]
+        # negative buffers erode the polygon instead of inflating it
+        self.assertTrue(geoms_out[0].is_empty)
+        self.assertTrue(geoms_out[1].equals(box(0.25, 0.25, 0.75, 0.75)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,38 +1,29 @@
 from typing import Any, Callable
 import unittest
 from os.path import join
-from uuid import uuid4
+from itertools import count
 
 import numpy as np
 
 from rastervision.pipeline.file_system import json_to_file, get_tmp_dir
 from rastervision.core.data import (
-    ClassConfig, DatasetConfig, RasterioSourceConfig, MultiRasterSourceConfig,
-    ReclassTransformerConfig, SceneConfig, ChipClassificationLabelSourceConfig,
-    GeoJSONVectorSourceConfig, ClassInferenceTransformerConfig)
+    ClassConfig, DatasetConfig, ConstantRasterSourceConfig, SceneConfig,
+    ChipClassificationLabelSourceConfig, GeoJSONVectorSourceConfig,
+    ClassInferenceTransformerConfig)
 from rastervision.core.rv_pipeline import ChipClassificationConfig
 from rastervision.pytorch_backend import PyTorchChipClassificationConfig
 from rastervision.pytorch_learner import (
     ClassificationModelConfig, SolverConfig, ClassificationGeoDataConfig,
     PlotOptions, GeoDataWindowConfig, GeoDataWindowMethod)
-from tests import data_file_path
+
+_scene_counter = count()
 
 
 def make_scene(num_channels: int, num_classes: int,
                tmp_dir: str) -> SceneConfig:
-    path = data_file_path('multi_raster_source/const_100_600x600.tiff')
-    rs_cfgs_img = []
-    for _ in range(num_channels):
-        rs_cfg = RasterioSourceConfig(
-            uris=[path],
-            channel_order=[0],
-            transformers=[
-                ReclassTransformerConfig(
-                    mapping={100: np.random.randint(0, 256)})
-            ])
-        rs_cfgs_img.append(rs_cfg)
-    rs_cfg_img = MultiRasterSourceConfig(
-        raster_sources=rs_cfgs_img, channel_order=list(range(num_channels)))
+    rs_cfg_img = ConstantRasterSourceConfig(
+        value=[np.random.randint(0, 256) for _ in range(num_channels)],
+        shape=(600, 600))
 
     geojson = {
         'type':
@@ -57,7 +48,7 @@ def make_scene(num_channels: int, num_classes: int,
                           ]),
         background_class_id=0)
     scene_cfg = SceneConfig(
-        id=str(uuid4()),
+        id=f'test_scene_{next(_scene_counter)}',
         raster_source=rs_cfg_img,
         label_source=label_source_cfg)
     return scene_cfg
@@ -363,38 +363,22 @@ class TestGeoDataConfig(unittest.TestCase):
         self.assertListEqual(cfg.class_colors, class_config.colors)
 
     def test_build_ss(self):
-        from uuid import uuid4
+        from itertools import count
         import numpy as np
         from rastervision.core.data import (
-            ClassConfig, DatasetConfig, RasterioSourceConfig,
-            MultiRasterSourceConfig, ReclassTransformerConfig, SceneConfig,
-            SemanticSegmentationLabelSourceConfig)
-        from tests import data_file_path
+            ClassConfig, DatasetConfig, ConstantRasterSourceConfig,
+            SceneConfig, SemanticSegmentationLabelSourceConfig)
+
+        scene_counter = count()
 
         def make_scene(num_channels: int, num_classes: int) -> SceneConfig:
-            path = data_file_path('multi_raster_source/const_100_600x600.tiff')
-            rs_cfgs_img = []
-            for _ in range(num_channels):
-                rs_cfg = RasterioSourceConfig(
-                    uris=[path],
-                    channel_order=[0],
-                    transformers=[
-                        ReclassTransformerConfig(
-                            mapping={100: np.random.randint(0, 256)})
-                    ])
-                rs_cfgs_img.append(rs_cfg)
-            rs_cfg_img = MultiRasterSourceConfig(
-                raster_sources=rs_cfgs_img,
-                channel_order=list(range(num_channels)))
-            rs_cfg_label = RasterioSourceConfig(
-                uris=[path],
-                channel_order=[0],
-                transformers=[
-                    ReclassTransformerConfig(
-                        mapping={100: np.random.randint(0, num_classes)})
-                ])
+            rs_cfg_img = ConstantRasterSourceConfig(
+                value=[np.random.randint(0, 256) for _ in range(num_channels)],
+                shape=(600, 600))
+            rs_cfg_label = ConstantRasterSourceConfig(
+                value=np.random.randint(0, num_classes), shape=(600, 600))
             scene_cfg = SceneConfig(
-                id=str(uuid4()),
+                id=f'test_scene_{next(scene_counter)}',
                 raster_source=rs_cfg_img,
                 label_source=SemanticSegmentationLabelSourceConfig(
                     raster_source=rs_cfg_label))
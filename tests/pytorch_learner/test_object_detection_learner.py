@@ -1,6 +1,6 @@
 from typing import Any, Callable
 import unittest
-from uuid import uuid4
+from itertools import count
 
 import numpy as np
 
@@ -17,6 +17,8 @@ from rastervision.pytorch_learner import (
     GeoDataWindowMethod)
 from tests import data_file_path
 
+_scene_counter = count()
+
 
 def make_scene(num_channels: int, num_classes: int,
                tmp_dir: str) -> SceneConfig:
@@ -40,7 +42,7 @@ def make_scene(num_channels: int, num_classes: int,
             transformers=[ClassInferenceTransformerConfig(
                 default_class_id=0)]))
     scene_cfg = SceneConfig(
-        id=str(uuid4()),
+        id=f'test_scene_{next(_scene_counter)}',
         raster_source=rs_cfg_img,
         label_source=label_source_cfg)
     return scene_cfg
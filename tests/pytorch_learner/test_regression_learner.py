@@ -1,20 +1,19 @@
 from typing import Any, Callable
 import unittest
 from os.path import join
-from uuid import uuid4
+from itertools import count
 
 import numpy as np
 import torch
 
 from rastervision.pipeline.file_system import get_tmp_dir
-from rastervision.core.data import (
-    ClassConfig, DatasetConfig, RasterioSourceConfig, MultiRasterSourceConfig,
-    ReclassTransformerConfig, SceneConfig, LabelSourceConfig)
+from rastervision.core.data import (ClassConfig, DatasetConfig,
+                                    ConstantRasterSourceConfig, SceneConfig,
+                                    LabelSourceConfig)
 from rastervision.pytorch_learner import (
     RegressionModelConfig, SolverConfig, RegressionGeoDataConfig,
     GeoDataWindowConfig, RegressionLearnerConfig, RegressionPlotOptions,
     RegressionLearner, GeoDataWindowMethod)
-from tests import data_file_path
 
 
 class MockRegressionabelSourceConfig(LabelSourceConfig):
@@ -22,24 +21,17 @@ class MockRegressionabelSourceConfig(LabelSourceConfig):
         pass
 
 
+_scene_counter = count()
+
+
 def make_scene(num_channels: int, num_classes: int,
                tmp_dir: str) -> SceneConfig:
-    path = data_file_path('multi_raster_source/const_100_600x600.tiff')
-    rs_cfgs_img = []
-    for _ in range(num_channels):
-        rs_cfg = RasterioSourceConfig(
-            uris=[path],
-            channel_order=[0],
-            transformers=[
-                ReclassTransformerConfig(
-                    mapping={100: np.random.randint(0, 256)})
-            ])
-        rs_cfgs_img.append(rs_cfg)
-    rs_cfg_img = MultiRasterSourceConfig(
-        raster_sources=rs_cfgs_img, channel_order=list(range(num_channels)))
+    rs_cfg_img = ConstantRasterSourceConfig(
+        value=[np.random.randint(0, 256) for _ in range(num_channels)],
+        shape=(600, 600))
 
     scene_cfg = SceneConfig(
-        id=str(uuid4()),
+        id=f'test_scene_{next(_scene_counter)}',
         raster_source=rs_cfg_img,
         label_source=MockRegressionabelSourceConfig())
     return scene_cfg